@@ -0,0 +1,73 @@
+# Brick wall generation benchmark: brick count against generation time.
+#
+# Run headless from the repository root:
+#   blender -b --factory-startup --python Benchmarks/BrickWallBenchmark.py
+
+import bpy
+import os
+import sys
+import time
+import importlib
+from types import SimpleNamespace
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_addon(name):
+    """Imports a tool module from the repository's arch_tools package without installing it"""
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    return importlib.import_module(f"arch_tools.{name}")
+
+
+brick_wall = load_addon("brick_wall")
+
+# Brick sizes to sweep; smaller bricks on a 40 m x 12 m facade give more bricks
+BRICK_SIZES = [0.7, 0.35, 0.2, 0.12, 0.08]
+
+
+def wall_props(brick_width):
+    return SimpleNamespace(
+        wall_length=40.0,
+        wall_height=12.0,
+        brick_width=brick_width,
+        brick_height=brick_width / 2,
+        brick_depth=0.3,
+        brick_gap=0.01,
+        stagger_rows=True,
+        curved_wall=False,
+        wall_radius=3.0,
+        angled_wall=False,
+        wall_angle=0.0,
+    )
+
+
+def time_build(build, props):
+    mesh = bpy.data.meshes.new("BrickWallBenchmark")
+    start = time.perf_counter()
+    build(mesh, props)
+    elapsed = time.perf_counter() - start
+    bpy.data.meshes.remove(mesh)
+    return elapsed
+
+
+def run():
+    print(f"{'bricks':>10} {'bmesh (s)':>12} {'numpy (s)':>12} {'speedup':>10}")
+    for brick_width in BRICK_SIZES:
+        props = wall_props(brick_width)
+        rows, cols = brick_wall.wall_grid(props)
+
+        bmesh_time = time_build(brick_wall.build_brick_mesh_bmesh, props)
+        if brick_wall.np is not None:
+            numpy_time = time_build(brick_wall.build_brick_mesh_numpy, props)
+            speedup = f"{bmesh_time / numpy_time:.1f}x"
+            numpy_text = f"{numpy_time:.4f}"
+        else:
+            numpy_text = speedup = "n/a"
+
+        print(f"{rows * cols:>10} {bmesh_time:>12.4f} {numpy_text:>12} {speedup:>10}")
+
+
+if __name__ == "__main__":
+    run()
+    sys.stdout.flush()
@@ -0,0 +1,64 @@
+# Curtain wall benchmark: per-mullion BMesh loop against the welded NumPy lattice.
+#
+# Run headless from the repository root:
+#   blender -b --factory-startup --python Benchmarks/CurtainWallBenchmark.py
+
+import bpy
+import os
+import sys
+import time
+import importlib
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_addon(name):
+    """Imports a tool module from the repository's arch_tools package without installing it"""
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    return importlib.import_module(f"arch_tools.{name}")
+
+
+curtain_wall = load_addon("curtain_wall")
+
+# (columns, rows) grids to sweep, up to a 200 column x 80 floor tower facade
+GRID_SIZES = [(5, 5), (20, 10), (50, 20), (100, 40), (200, 80)]
+MULLION_THICKNESS = 0.05
+MULLION_DEPTH = 0.15
+
+
+def time_build(build, columns, rows):
+    """Returns (seconds, vertex count, face count) for one build of both meshes"""
+    panel_mesh = bpy.data.meshes.new("CurtainWallBenchmarkPanels")
+    mullion_mesh = bpy.data.meshes.new("CurtainWallBenchmarkMullions")
+    width, height = columns * 1.5, rows * 3.5
+
+    start = time.perf_counter()
+    build(panel_mesh, mullion_mesh, width, height, columns, rows, MULLION_THICKNESS, MULLION_DEPTH)
+    elapsed = time.perf_counter() - start
+
+    verts = len(panel_mesh.vertices) + len(mullion_mesh.vertices)
+    faces = len(panel_mesh.polygons) + len(mullion_mesh.polygons)
+    bpy.data.meshes.remove(panel_mesh)
+    bpy.data.meshes.remove(mullion_mesh)
+    return elapsed, verts, faces
+
+
+def run():
+    print(f"{'grid':>9} | {'loop verts':>10} {'faces':>8} {'time (s)':>9} | "
+          f"{'numpy verts':>11} {'faces':>8} {'time (s)':>9} | {'speedup':>7}")
+    for columns, rows in GRID_SIZES:
+        loop_time, loop_verts, loop_faces = time_build(curtain_wall.build_curtain_wall_bmesh, columns, rows)
+        line = f"{columns:>4}x{rows:<4} | {loop_verts:>10} {loop_faces:>8} {loop_time:>9.4f} | "
+
+        if curtain_wall.np is not None:
+            numpy_time, numpy_verts, numpy_faces = time_build(curtain_wall.build_curtain_wall_numpy, columns, rows)
+            line += f"{numpy_verts:>11} {numpy_faces:>8} {numpy_time:>9.4f} | {loop_time / numpy_time:>6.1f}x"
+        else:
+            line += f"{'n/a':>11} {'n/a':>8} {'n/a':>9} | {'n/a':>7}"
+        print(line)
+
+
+if __name__ == "__main__":
+    run()
+    sys.stdout.flush()
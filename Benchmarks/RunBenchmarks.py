@@ -0,0 +1,241 @@
+# Headless benchmark and regression suite for the geometry generators.
+#
+# Registers each addon, sweeps its size parameters and records wall time,
+# peak RSS, vertex/face counts and a geometry checksum into a JSON report.
+# With a baseline, the run fails when a case got slower than the threshold
+# allows or its geometry changed.
+#
+# ru_maxrss is a high-water mark for the whole process, so every case runs
+# in a Blender process of its own and its peak RSS is that process's peak.
+#
+# Run from the repository root:
+#   blender -b --factory-startup --python Benchmarks/RunBenchmarks.py -- \
+#       [--report report.json] [--baseline Benchmarks/baseline.json] \
+#       [--threshold 0.25] [--repeat 3] [--update-baseline]
+
+import bpy
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import importlib
+import subprocess
+import tempfile
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "Benchmarks", "baseline.json")
+
+
+def load_addon(name):
+    """Imports a tool module from the repository's arch_tools package and registers it"""
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    module = importlib.import_module(f"arch_tools.{name}")
+    module.register()
+    return module
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # Bytes on macOS
+
+
+def geometry_stats(obj_names):
+    """Returns (verts, faces, checksum) over the meshes of the named objects"""
+    digest = hashlib.sha1()
+    verts = faces = 0
+    for name in obj_names:
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.type != 'MESH':
+            continue
+        mesh = obj.data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        loops = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loops)
+
+        digest.update(name.encode())
+        digest.update(np.round(co, 4).astype(np.float32).tobytes())
+        digest.update(loops.tobytes())
+        verts += len(mesh.vertices)
+        faces += len(mesh.polygons)
+    return verts, faces, digest.hexdigest()
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in [m for m in bpy.data.meshes if m.users == 0]:
+        bpy.data.meshes.remove(mesh)
+
+
+def measure(setup, build, obj_names, repeat):
+    """Runs setup(), then build() repeat times on a clean scene, keeping the fastest run.
+
+    setup sets the case's properties outside the timer, since their update
+    callbacks may build geometry of their own.
+    """
+    setup()
+    best = None
+    for _ in range(repeat):
+        clear_scene()
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    verts, faces, checksum = geometry_stats(obj_names)
+    return {
+        "seconds": best,
+        "peak_rss_kb": peak_rss_kb(),
+        "verts": verts,
+        "faces": faces,
+        "checksum": checksum,
+    }
+
+
+def no_setup():
+    pass
+
+
+def brick_wall_cases(context):
+    brick_wall = load_addon("brick_wall")
+    props = context.scene.parametric_brick_wall
+    for brick_width in [0.7, 0.35, 0.2, 0.1]:
+        def setup(brick_width=brick_width):
+            props.wall_length, props.wall_height = 40.0, 12.0
+            props.brick_width, props.brick_height = brick_width, brick_width / 2
+
+        def build():
+            brick_wall.create_brick_wall(context, props)
+        yield f"brick_wall/brick_width={brick_width}", setup, build, ["BrickWall"]
+
+
+def curtain_wall_cases(context):
+    curtain_wall = load_addon("curtain_wall")
+    for columns, rows in [(5, 5), (50, 20), (200, 80)]:
+        def build(columns=columns, rows=rows):
+            curtain_wall.create_curtain_wall(columns * 1.5, rows * 3.5, columns, rows, 0.05, 0.15)
+        yield f"curtain_wall/grid={columns}x{rows}", no_setup, build, ["CurtainWall_Panels", "CurtainWall_Mullions"]
+
+
+def canvas_cases(context):
+    canvas = load_addon("canvas")
+    props = context.scene.v_props
+    for subdivision in [10, 50, 100]:
+        def setup(subdivision=subdivision):
+            props.subdivision = subdivision  # Its update callback builds a canvas too
+
+        def build():
+            canvas.create_plane_from_anchors(context)
+        yield f"canvas/subdivision={subdivision}", setup, build, ["Canvas1"]
+
+
+def tensile_cases(context):
+    load_addon("tensile_membrane")
+    for resolution in [20, 50, 100]:
+        def build(resolution=resolution):
+            bpy.ops.object.tensile_membrane_generate(resolution=resolution)
+        yield f"tensile_membrane/resolution={resolution}", no_setup, build, ["TensileStructure"]
+
+
+SUITES = [brick_wall_cases, curtain_wall_cases, canvas_cases, tensile_cases]
+
+
+def compare(results, baseline, threshold):
+    """Returns a list of regression messages against the baseline results"""
+    failures = []
+    for case, result in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        if result["seconds"] > base["seconds"] * (1.0 + threshold):
+            failures.append(f"{case}: {result['seconds']:.4f}s vs baseline {base['seconds']:.4f}s")
+        for key in ["verts", "faces", "checksum"]:
+            if result[key] != base[key]:
+                failures.append(f"{case}: {key} changed from {base[key]} to {result[key]}")
+    return failures
+
+
+def all_cases(context):
+    for suite in SUITES:
+        yield from suite(context)
+
+
+def run_case(case, args):
+    """Runs one case in a fresh Blender process and returns its result"""
+    with tempfile.TemporaryDirectory() as folder:
+        report = os.path.join(folder, "case.json")
+        subprocess.run(
+            [
+                bpy.app.binary_path, "-b", "--factory-startup", "--python-exit-code", "1",
+                "--python", os.path.abspath(__file__), "--",
+                "--case", case, "--repeat", str(args.repeat), "--report", report,
+            ],
+            check=True, stdout=subprocess.DEVNULL,
+        )
+        with open(report) as file:
+            return json.load(file)["results"][case]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the geometry generators")
+    parser.add_argument("--report", default="bench_report.json", help="Where to write the JSON report")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown as a fraction")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case, the fastest is kept")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--case", help=argparse.SUPPRESS)  # Set on the per-case child processes
+    args = parser.parse_args(argv)
+
+    context = bpy.context
+    results = {}
+    if args.case:
+        for case, setup, build, obj_names in all_cases(context):
+            if case == args.case:
+                results[case] = measure(setup, build, obj_names, args.repeat)
+        with open(args.report, "w") as file:
+            json.dump({"blender": bpy.app.version_string, "results": results}, file, indent=4)
+        return 0
+
+    for case, _, _, _ in all_cases(context):
+        r = results[case] = run_case(case, args)
+        rss = "" if r["peak_rss_kb"] is None else f" {r['peak_rss_kb']:>9} KB peak"
+        print(f"{case:<40} {r['seconds']:>9.4f}s {r['verts']:>9} verts {r['faces']:>9} faces{rss}")
+
+    report = {"blender": bpy.app.version_string, "results": results}
+    with open(args.report, "w") as file:
+        json.dump(report, file, indent=4)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=4)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against, run with --update-baseline first")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    failures = compare(results, baseline, args.threshold)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    sys.exit(main(argv))
@@ -0,0 +1,105 @@
+# Startup cost of each addon in a headless Blender.
+#
+# Starts `blender -b --factory-startup --python-expr ...` once with nothing
+# enabled, once per arch_tools module and once for the whole extension. Each
+# is imported and registered inside the expression. Reports the import + register time, the whole process
+# time against the empty baseline, and which heavy modules ended up
+# executed. Numbers are the fastest of --repeat runs.
+#
+# Run with plain Python from the repository root:
+#   python Benchmarks/StartupTime.py [--blender blender] [--repeat 5] [--report startup.json]
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the addons should not be paying for until an operator needs them
+HEAVY_MODULES = ["numpy", "scipy", "scipy.sparse", "sqlite3", "concurrent.futures"]
+
+ADDON_EXPR = """
+import sys, time, json, importlib
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+module = importlib.import_module({module!r})
+module.register()
+elapsed = time.perf_counter() - start
+# A lazily imported module only turns into a plain module once it has run
+loaded = [name for name in {heavy!r} if type(sys.modules.get(name)).__name__ == "module"]
+print("STARTUP " + json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def find_addons():
+    """Each arch_tools module on its own, then the whole extension"""
+    sys.path.insert(0, REPO_ROOT)
+    import arch_tools  # bpy-free, only lists the modules
+
+    return [f"arch_tools.{name}" for name in arch_tools.MODULES] + ["arch_tools"]
+
+
+def run_blender(blender, expr):
+    """Returns (process seconds, parsed STARTUP line or None)"""
+    start = time.perf_counter()
+    process = subprocess.run(
+        [blender, "-b", "--factory-startup", "--python-exit-code", "1", "--python-expr", expr],
+        capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    for line in process.stdout.splitlines():
+        if line.startswith("STARTUP "):
+            return elapsed, json.loads(line[len("STARTUP "):])
+    return elapsed, None
+
+
+def measure(blender, expr, repeat):
+    best_process = best_result = None
+    for _ in range(repeat):
+        process_seconds, result = run_blender(blender, expr)
+        if result is None:
+            return process_seconds, None
+        best_process = process_seconds if best_process is None else min(best_process, process_seconds)
+        if best_result is None or result["seconds"] < best_result["seconds"]:
+            best_result = result
+    return best_process, best_result
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Measure the startup cost of each addon in headless Blender")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per addon, the fastest is kept")
+    parser.add_argument("--report", help="Optional JSON file for the results")
+    args = parser.parse_args(argv)
+
+    baseline, _ = measure(args.blender, "print('STARTUP {\"seconds\": 0, \"loaded\": []}')", args.repeat)
+    print(f"{'(no addon)':<52} {'':>10} {baseline:>8.3f}s")
+
+    results = {"baseline_seconds": baseline, "addons": {}}
+    failed = False
+    for name in find_addons():
+        expr = ADDON_EXPR.format(root=REPO_ROOT, module=name, heavy=HEAVY_MODULES)
+        process_seconds, result = measure(args.blender, expr, args.repeat)
+        if result is None:
+            print(f"{name:<52} failed to register")
+            failed = True
+            continue
+
+        results["addons"][name] = {**result, "process_seconds": process_seconds}
+        loaded = ", ".join(result["loaded"]) or "-"
+        print(
+            f"{name:<52} {result['seconds'] * 1000:>8.1f}ms {process_seconds:>8.3f}s "
+            f"{process_seconds - baseline:>+7.3f}s  heavy: {loaded}"
+        )
+
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(results, file, indent=4)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,223 @@
+# Parameter sweep for the Canvas Gen cloth settings.
+#
+# Runs every combination of cloth mass, bending stiffness and air damping
+# against every anchor configuration. The cases are split into batches and
+# fanned out over headless Blender workers, one thread each so the sweep
+# scales with cores. Each case is baked to its settle frame. The sag, max
+# displacement and bake time go into a results table, and each settled mesh
+# is saved as an .npy vertex array next to it.
+#
+# Run with plain Python from the repository root:
+#   python "Cloth Sweep/ClothSweep.py" --mass 0.3 1 3 --bending 0.1 0.5 \
+#       --damping 1 5 [--anchors anchors.json] [--workers 32] [--output sweep]
+#
+# anchors.json holds a list of {"name": ..., "anchors": [[x, y, z] x 4]}.
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import itertools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_ANCHORS = [
+    {"name": "flat", "anchors": [[-1, -1, 0], [1, -1, 0], [1, 1, 0], [-1, 1, 0]]},
+]
+
+RESULT_FIELDS = [
+    "case", "anchors", "mass", "bending_stiffness", "air_damping",
+    "sag", "max_displacement", "bake_seconds", "verts", "mesh", "error",
+]
+
+
+def sweep_cases(args):
+    """Every combination of anchor configuration and cloth parameters"""
+    if args.anchors:
+        with open(args.anchors) as file:
+            anchor_sets = json.load(file)
+    else:
+        anchor_sets = DEFAULT_ANCHORS
+
+    cases = []
+    for anchor_set, mass, bending, damping in itertools.product(anchor_sets, args.mass, args.bending, args.damping):
+        cases.append({
+            "case": f"{anchor_set['name']}_m{mass:g}_b{bending:g}_d{damping:g}",
+            "anchors": anchor_set["anchors"],
+            "anchor_set": anchor_set["name"],
+            "mass": mass,
+            "bending_stiffness": bending,
+            "air_damping": damping,
+            "subdivision": args.subdivision,
+            "settle_frame": args.settle_frame,
+        })
+    return cases
+
+
+def batches(cases, workers):
+    """Splits the cases into a few batches per worker, so no worker sits idle
+    at the end while one Blender start-up still covers several cases"""
+    count = min(len(cases), workers * 4)
+    return [cases[i::count] for i in range(count)]
+
+
+def run_batch(blender, batch, batch_path, output_dir):
+    """Runs one batch in a headless Blender and returns its result rows"""
+    with open(batch_path, "w") as file:
+        json.dump(batch, file)
+    results_path = batch_path.replace(".json", "_results.json")
+
+    command = [
+        blender, "-b", "--factory-startup", "--threads", "1",
+        "--python", os.path.abspath(__file__), "--",
+        "--worker", batch_path, "--results", results_path, "--output", output_dir,
+    ]
+    process = subprocess.run(command, capture_output=True, text=True)
+    if process.returncode != 0 or not os.path.exists(results_path):
+        error = (process.stderr.strip().splitlines() or [f"exit code {process.returncode}"])[-1]
+        return [{**case, "error": error} for case in batch]
+
+    with open(results_path) as file:
+        return json.load(file)
+
+
+def run_sweep(args):
+    cases = sweep_cases(args)
+    batch_dir = os.path.join(args.output, "batches")
+    os.makedirs(batch_dir, exist_ok=True)
+
+    print(f"{len(cases)} cases on {args.workers} workers")
+    start = time.perf_counter()
+    rows = []
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(run_batch, args.blender, batch, os.path.join(batch_dir, f"batch_{i:04d}.json"), args.output)
+            for i, batch in enumerate(batches(cases, args.workers))
+        ]
+        for future in as_completed(futures):
+            for row in future.result():
+                rows.append(row)
+                status = row.get("error") or f"sag {row['sag']:.4f}  {row['bake_seconds']:.2f}s"
+                print(f"[{len(rows)}/{len(cases)}] {row['case']:<40} {status}")
+
+    rows.sort(key=lambda row: row["case"])
+    table_path = os.path.join(args.output, "results.csv")
+    with open(table_path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**row, "anchors": row["anchor_set"]})
+
+    failed = sum(1 for row in rows if row.get("error"))
+    print(f"Swept {len(rows)} cases in {time.perf_counter() - start:.1f}s, {failed} failed. Results in {table_path}")
+    return 1 if failed else 0
+
+
+# Worker side, inside Blender
+def bake_case(context, canvas, case, output_dir):
+    """Bakes one case to its settle frame and returns its result row"""
+    import numpy as np
+
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in [m for m in bpy.data.meshes if m.users == 0]:
+        bpy.data.meshes.remove(mesh)
+
+    props = context.scene.v_props
+    for (x, y, z), suffix in zip(case["anchors"], ["one", "two", "three", "four"]):
+        setattr(props, f"anc_pointsx_{suffix}", x)
+        setattr(props, f"anc_pointsy_{suffix}", y)
+        setattr(props, f"anc_pointsz_{suffix}", z)
+    props.subdivision = case["subdivision"]
+    props.cloth_mass = case["mass"]
+    props.cloth_bending_stiffness = case["bending_stiffness"]
+    props.cloth_air_damping = case["air_damping"]
+    canvas.create_plane_from_anchors(context)
+
+    obj = bpy.data.objects["Canvas1"]
+    point_cache = obj.modifiers["Cloth"].point_cache
+    point_cache.frame_end = case["settle_frame"]
+
+    # Cloth only steps forward one frame at a time, so play the range through
+    scene = context.scene
+    start = time.perf_counter()
+    for frame in range(point_cache.frame_start, case["settle_frame"] + 1):
+        scene.frame_set(frame)
+    evaluated = obj.evaluated_get(context.evaluated_depsgraph_get())
+    settled_mesh = evaluated.to_mesh()
+    settled = np.empty(len(settled_mesh.vertices) * 3, dtype=np.float32)
+    settled_mesh.vertices.foreach_get("co", settled)
+    evaluated.to_mesh_clear()
+    bake_seconds = time.perf_counter() - start
+
+    settled = settled.reshape(-1, 3)
+    flat = canvas.kernel.bilinear_grid(canvas.anchor_points(props), props.subdivision)
+    mesh_path = os.path.join(output_dir, "meshes", case["case"] + ".npy")
+    np.save(mesh_path, settled)
+
+    return {
+        **case,
+        "sag": float((flat[:, 2] - settled[:, 2]).max()),
+        "max_displacement": float(np.linalg.norm(settled - flat, axis=1).max()),
+        "bake_seconds": bake_seconds,
+        "verts": len(settled),
+        "mesh": os.path.relpath(mesh_path, output_dir),
+    }
+
+
+def run_worker(args):
+    sys.path.insert(0, REPO_ROOT)
+    from arch_tools import canvas
+
+    canvas.register()
+    # Simulate every case; the user's settled-shape cache would otherwise short-circuit it
+    canvas.SHAPE_CACHE_DIR = os.path.join(os.path.dirname(args.results), "no_shape_cache")
+
+    os.makedirs(os.path.join(args.output, "meshes"), exist_ok=True)
+    with open(args.worker) as file:
+        batch = json.load(file)
+
+    rows = []
+    for case in batch:
+        try:
+            rows.append(bake_case(bpy.context, canvas, case, args.output))
+        except Exception as error:  # Keep the rest of the batch going
+            rows.append({**case, "error": f"{type(error).__name__}: {error}"})
+
+    with open(args.results, "w") as file:
+        json.dump(rows, file)
+    return 0
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Sweep Canvas Gen cloth settings over headless Blender workers")
+    parser.add_argument("--mass", type=float, nargs="+", default=[1.0], help="Cloth mass values")
+    parser.add_argument("--bending", type=float, nargs="+", default=[0.5], help="Bending stiffness values")
+    parser.add_argument("--damping", type=float, nargs="+", default=[5.0], help="Air damping values")
+    parser.add_argument("--anchors", help="JSON file of named anchor configurations")
+    parser.add_argument("--subdivision", type=int, default=20, help="Canvas subdivision for every case")
+    parser.add_argument("--settle-frame", type=int, default=120, help="Frame the cloth is baked to")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Blender processes to run at once")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable")
+    parser.add_argument("--output", default="cloth_sweep", help="Directory for the table and meshes")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--results", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    args.output = os.path.abspath(args.output)
+
+    if args.worker:
+        return run_worker(args)
+    return run_sweep(args)
+
+
+if __name__ == "__main__":
+    try:
+        import bpy
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    except ImportError:  # Coordinator, outside Blender
+        argv = sys.argv[1:]
+    sys.exit(main(argv))
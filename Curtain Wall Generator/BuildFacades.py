@@ -0,0 +1,18 @@
+# Builds curtain wall facades from a spec file in a headless Blender, without
+# installing the Architecture Tools extension.
+#
+# Run from the repository root:
+#   blender -b --python "Curtain Wall Generator/BuildFacades.py" -- \
+#       --facades "Curtain Wall Generator/facades_example.json" [--workers N] [--output out.blend]
+
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from arch_tools import curtain_wall
+
+if __name__ == "__main__":
+    curtain_wall.register()
+    curtain_wall.main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,47 @@
+# Architecture Tools: the generators as one Blender extension.
+#
+# Each tool is a submodule with its own register() and unregister(). The
+# array work they share lives in kernel.py, which only needs NumPy, so
+# `import arch_tools.kernel` also works in a plain Python session. Nothing
+# in this file imports bpy, and the tool modules are only imported when the
+# extension registers.
+
+import importlib
+import importlib.util
+import sys
+
+MODULES = [
+    "brick_wall",
+    "curtain_wall",
+    "canvas",
+    "tensile_membrane",
+    "edge_to_wall",
+    "drafting_tools",
+    "linework_import",
+    "orphan_report",
+]
+
+
+def lazy_import(name):
+    """Returns the named module, only executed on first attribute access, or
+    None when it isn't installed. Keeps addon startup from paying for it."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def register():
+    for name in MODULES:
+        importlib.import_module(f"{__name__}.{name}").register()
+
+
+def unregister():
+    for name in reversed(MODULES):
+        importlib.import_module(f"{__name__}.{name}").unregister()
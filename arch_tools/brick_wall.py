@@ -0,0 +1,636 @@
+# Parametric Brick Wall: creates a customizable parametric brick wall.
+
+import bpy
+import bmesh
+import math
+import hashlib
+import time
+from bpy.props import FloatProperty, BoolProperty, FloatVectorProperty, EnumProperty
+
+from . import kernel, lazy_import
+from .kernel import BOX_CORNERS, BOX_FACES
+from .materials import cached_material, remove_orphan_materials
+from .mesh_utils import append_mesh_data, mesh_bytes, record_reclaimed, remove_output, replace_output, truncate_mesh_data, write_mesh_data, write_mesh_loops
+
+np = lazy_import("numpy")  # None falls back to the per-brick BMesh path
+
+
+# Material slot of every brick face: 0 = brick on the exposed front and
+# back, 1 = mortar on the bed and head joints
+BRICK_FACE_MATERIALS = (1, 1, 0, 1, 0, 1)
+
+
+def wall_grid(props):
+    """Returns the (rows, cols) brick count for the wall"""
+    cols = int(props.wall_length / (props.brick_width + props.brick_gap))
+    rows = int(props.wall_height / (props.brick_height + props.brick_gap))
+    return rows, cols
+
+
+def brick_position(props, row, col, cols):
+    """Returns the (x, y, z) origin of the brick at (row, col)"""
+    if props.curved_wall:
+        angle_offset = (col / cols) * (props.wall_length / props.wall_radius)
+        x_offset = props.wall_radius * math.sin(angle_offset)
+        y_offset = props.wall_radius * math.cos(angle_offset) - props.wall_radius
+    else:
+        x_offset = col * (props.brick_width + props.brick_gap)
+        y_offset = 0
+
+    z_offset = row * (props.brick_height + props.brick_gap)
+
+    # Stagger every other row
+    if props.stagger_rows and row % 2 == 1:
+        x_offset += (props.brick_width + props.brick_gap) / 2
+
+    # Apply inclination if angled wall is enabled
+    if props.angled_wall:
+        z_offset += math.tan(math.radians(props.wall_angle)) * x_offset
+
+    return x_offset, y_offset, z_offset
+
+
+def brick_rotation(props, col, cols):
+    """Returns the Z rotation that keeps a brick tangent to a curved wall"""
+    if props.curved_wall:
+        return -(col / cols) * (props.wall_length / props.wall_radius)
+    return 0.0
+
+
+def brick_offsets(props, rows, cols, index=None):
+    """Vectorized brick_position: (rows * cols, 3) origins in row-major order.
+
+    index optionally selects a subset of the row-major brick indices.
+    """
+    if index is None:
+        index = np.arange(rows * cols)
+    row, col = np.divmod(index, cols)
+
+    if props.curved_wall:
+        angle_offset = (col / cols) * (props.wall_length / props.wall_radius)
+        x_offset = props.wall_radius * np.sin(angle_offset)
+        y_offset = props.wall_radius * np.cos(angle_offset) - props.wall_radius
+    else:
+        x_offset = col * (props.brick_width + props.brick_gap)
+        y_offset = np.zeros(len(col))
+
+    z_offset = row * (props.brick_height + props.brick_gap)
+
+    if props.stagger_rows:
+        x_offset = x_offset + (row % 2) * ((props.brick_width + props.brick_gap) / 2)
+
+    if props.angled_wall:
+        z_offset = z_offset + math.tan(math.radians(props.wall_angle)) * x_offset
+
+    return np.column_stack((x_offset, y_offset, z_offset))
+
+
+def brick_rotations(props, rows, cols, index=None):
+    """Vectorized brick_rotation: (rows * cols,) Z rotations in row-major order"""
+    if index is None:
+        index = np.arange(rows * cols)
+    col = index % cols
+    if props.curved_wall:
+        return -(col / cols) * (props.wall_length / props.wall_radius)
+    return np.zeros(len(col))
+
+
+def brick_size(props):
+    return props.brick_width, props.brick_depth, props.brick_height
+
+
+def brick_corners(props, rows, cols, index=None):
+    """Returns the (N, 8, 3) corners of the selected bricks (all by default)"""
+    offsets = brick_offsets(props, rows, cols, index)
+    return kernel.box_corners(offsets, brick_size(props), brick_rotations(props, rows, cols, index))
+
+
+def brick_geometry(props, rows, cols):
+    """Returns (verts, faces) arrays for every brick of the wall.
+
+    verts is (N * 8, 3) and faces is (N * 6, 4), where N = rows * cols.
+    Brick i owns vertices [i * 8, i * 8 + 8) and faces [i * 6, i * 6 + 6).
+    """
+    return kernel.box_arrays(brick_offsets(props, rows, cols), brick_size(props), brick_rotations(props, rows, cols))
+
+
+def create_brick(bm, x, y, z, props, rotation=0.0):
+    """Creates a single brick at position (x, y, z), rotated about Z"""
+    w, d, h = brick_size(props)
+    cos, sin = math.cos(rotation), math.sin(rotation)
+    verts = [
+        bm.verts.new((x + cx * w * cos - cy * d * sin, y + cx * w * sin + cy * d * cos, z + cz * h))
+        for cx, cy, cz in BOX_CORNERS
+    ]
+
+    for face, material_index in zip(BOX_FACES, BRICK_FACE_MATERIALS):
+        bm.faces.new([verts[i] for i in face]).material_index = material_index
+
+
+def build_brick_mesh_bmesh(mesh, props):
+    """Pure-Python fallback: builds the wall one brick at a time through BMesh"""
+    rows, cols = wall_grid(props)
+
+    bm = bmesh.new()
+    for row in range(rows):
+        for col in range(cols):
+            x, y, z = brick_position(props, row, col, cols)
+            create_brick(bm, x, y, z, props, brick_rotation(props, col, cols))
+
+    bm.to_mesh(mesh)
+    bm.free()
+    return rows * cols
+
+
+def build_brick_mesh_numpy(mesh, props):
+    """Builds the whole wall as arrays and writes it to the mesh in bulk"""
+    rows, cols = wall_grid(props)
+    verts, faces = brick_geometry(props, rows, cols)
+    write_mesh_data(mesh, verts, faces)
+    set_brick_materials(mesh, rows * cols)
+    return rows * cols
+
+
+def set_brick_materials(mesh, count):
+    """Assigns the brick and mortar slots to the faces of count bricks"""
+    mesh.polygons.foreach_set("material_index", np.tile(np.array(BRICK_FACE_MATERIALS, dtype=np.int32), count))
+
+
+def build_brick_mesh(mesh, props):
+    """Fills an empty mesh with the brick wall, returns the brick count"""
+    if np is None:
+        return build_brick_mesh_bmesh(mesh, props)
+    return build_brick_mesh_numpy(mesh, props)
+
+
+def brick_layout(props):
+    """Returns the layout record stored on the wall object after a build.
+
+    "shape" hashes every parameter that moves existing bricks. Walls that
+    share a shape differ only in which rows and columns exist, so they can
+    be resized by update_brick_mesh without a full rebuild.
+    """
+    rows, cols = wall_grid(props)
+    shape = (
+        props.brick_width, props.brick_height, props.brick_depth, props.brick_gap,
+        props.stagger_rows, props.output_mode,
+        props.curved_wall, props.angled_wall, props.wall_angle,
+    )
+    if props.curved_wall:
+        # The curve angle of every brick depends on the wall length and column count
+        shape += (props.wall_radius, props.wall_length, cols)
+    return {
+        "rows": rows,
+        "cols": cols,
+        "verts_per_brick": len(BOX_CORNERS),
+        "shape": hashlib.sha1(repr(shape).encode()).hexdigest(),
+    }
+
+
+def update_brick_mesh(mesh, props, old_rows, old_cols):
+    """Resizes a wall built with (old_rows, old_cols) bricks in place.
+
+    Bricks are stored row-major, so added or removed courses are a tail of
+    the mesh: added bricks are computed and appended, removed ones are cut
+    off, and the kept bricks are never recomputed. Added or removed columns
+    shift every later brick, so they rebuild the whole mesh. Returns the
+    brick count.
+    """
+    rows, cols = wall_grid(props)
+    if cols != old_cols:
+        mesh.clear_geometry()
+        return build_brick_mesh_numpy(mesh, props)
+
+    if rows < old_rows:
+        count = rows * cols
+        truncate_mesh_data(mesh, count * len(BOX_CORNERS), count * len(BOX_FACES))
+        return count
+
+    added = np.arange(old_rows * cols, rows * cols)
+    append_mesh_data(
+        mesh, brick_corners(props, rows, cols, added).reshape(-1, 3), kernel.box_faces(len(added)),
+        np.tile(np.array(BRICK_FACE_MATERIALS, dtype=np.int32), len(added)),
+    )
+    return rows * cols
+
+
+def build_brick_points(mesh, props):
+    """Fills an empty mesh with one vertex per brick and a "rotation" attribute.
+
+    The point cloud is what the instanced output mode stores instead of
+    unique brick geometry.
+    """
+    rows, cols = wall_grid(props)
+    if np is None:
+        offsets = [brick_position(props, row, col, cols) for row in range(rows) for col in range(cols)]
+        rotations = [(0.0, 0.0, brick_rotation(props, col, cols)) for row in range(rows) for col in range(cols)]
+        mesh.from_pydata(offsets, [], [])
+        mesh.attributes.new("rotation", 'FLOAT_VECTOR', 'POINT').data.foreach_set(
+            "vector", [v for rot in rotations for v in rot]
+        )
+        return rows * cols
+
+    offsets = brick_offsets(props, rows, cols)
+    rotations = np.zeros((len(offsets), 3), dtype=np.float32)
+    rotations[:, 2] = brick_rotations(props, rows, cols)
+
+    mesh.vertices.add(len(offsets))
+    mesh.vertices.foreach_set("co", offsets.astype(np.float32).ravel())
+    mesh.attributes.new("rotation", 'FLOAT_VECTOR', 'POINT').data.foreach_set("vector", rotations.ravel())
+    mesh.update()
+    return rows * cols
+
+
+def build_brick_prototype(mesh, props):
+    """Fills an empty mesh with the single brick shared by every instance"""
+    bm = bmesh.new()
+    create_brick(bm, 0.0, 0.0, 0.0, props)
+    bm.to_mesh(mesh)
+    bm.free()
+
+
+def brick_instancer_node_group(prototype):
+    """Returns the geometry node group that instances prototype on every point"""
+    group = bpy.data.node_groups.get("BrickWallInstancer")
+    if group is None:
+        group = bpy.data.node_groups.new("BrickWallInstancer", 'GeometryNodeTree')
+        group.interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        group.interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+        nodes = group.nodes
+        links = group.links
+        group_in = nodes.new("NodeGroupInput")
+        group_out = nodes.new("NodeGroupOutput")
+        object_info = nodes.new("GeometryNodeObjectInfo")
+        object_info.name = "Brick Prototype"
+        rotation = nodes.new("GeometryNodeInputNamedAttribute")
+        rotation.data_type = 'FLOAT_VECTOR'
+        rotation.inputs["Name"].default_value = "rotation"
+        instance = nodes.new("GeometryNodeInstanceOnPoints")
+
+        links.new(group_in.outputs["Geometry"], instance.inputs["Points"])
+        links.new(object_info.outputs["Geometry"], instance.inputs["Instance"])
+        links.new(rotation.outputs["Attribute"], instance.inputs["Rotation"])
+        links.new(instance.outputs["Instances"], group_out.inputs["Geometry"])
+
+    group.nodes["Brick Prototype"].inputs["Object"].default_value = prototype
+    return group
+
+
+def realize_brick_instances(obj, prototype):
+    """Replaces the point cloud of an instanced wall with real brick geometry"""
+    points = obj.data
+    proto = prototype.data
+
+    n = len(points.vertices)
+    offsets = np.empty(n * 3, dtype=np.float32)
+    points.vertices.foreach_get("co", offsets)
+    rotations = np.zeros(n * 3, dtype=np.float32)
+    if "rotation" in points.attributes:
+        points.attributes["rotation"].data.foreach_get("vector", rotations)
+
+    local_verts = np.empty(len(proto.vertices) * 3, dtype=np.float32)
+    proto.vertices.foreach_get("co", local_verts)
+    local_loops = np.empty(len(proto.loops), dtype=np.int32)
+    proto.loops.foreach_get("vertex_index", local_loops)
+    local_starts = np.empty(len(proto.polygons), dtype=np.int32)
+    proto.polygons.foreach_get("loop_start", local_starts)
+    local_materials = np.empty(len(proto.polygons), dtype=np.int32)
+    proto.polygons.foreach_get("material_index", local_materials)
+
+    verts = kernel.place_instances(local_verts.reshape(-1, 3), offsets.reshape(-1, 3), rotations.reshape(-1, 3)[:, 2])
+    loop_verts = local_loops[None, :] + (np.arange(n) * len(proto.vertices))[:, None]
+    loop_starts = local_starts[None, :] + (np.arange(n) * len(proto.loops))[:, None]
+
+    mesh = bpy.data.meshes.new("BrickWallMesh")
+    write_mesh_loops(mesh, verts.reshape(-1, 3), loop_verts.ravel(), loop_starts.ravel())
+    mesh.polygons.foreach_set("material_index", np.tile(local_materials, n))
+    for mat in proto.materials:
+        mesh.materials.append(mat)
+    return mesh
+
+
+GENERATOR = "Brick Wall"
+
+
+def create_brick_wall(context, props):
+    """Builds the BrickWall object, resizing the existing wall in place when possible"""
+    layout = brick_layout(props)
+    if update_brick_wall(props, layout):
+        return bpy.data.objects["BrickWall"]
+
+    if props.output_mode == 'INSTANCED':
+        obj = create_instanced_wall(context, props)
+    else:
+        # Reuse the old wall's mesh if it exists
+        remove_output("BrickPrototype", GENERATOR)
+        obj, mesh = replace_output(context, "BrickWall", "BrickWallMesh", GENERATOR)
+        instancer = obj.modifiers.get("BrickInstances")
+        if instancer:
+            obj.modifiers.remove(instancer)
+
+        build_brick_mesh(mesh, props)
+
+        # Apply materials
+        apply_material(obj, props)
+
+    obj["brick_layout"] = layout
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+    return obj
+
+
+def update_brick_wall(props, layout):
+    """Updates the existing wall in place when its layout allows it.
+
+    Returns False when the wall has to be rebuilt from scratch.
+    """
+    obj = bpy.data.objects.get("BrickWall")
+    if np is None or obj is None or "brick_layout" not in obj:
+        return False
+
+    old = obj["brick_layout"]
+    old_rows, old_cols = old["rows"], old["cols"]
+    if old["shape"] != layout["shape"]:
+        return False
+
+    if (old_rows, old_cols) != (layout["rows"], layout["cols"]):
+        if props.output_mode != 'MESH':
+            return False
+        if len(obj.data.vertices) != old_rows * old_cols * old["verts_per_brick"]:
+            return False  # The mesh was edited by hand since the last build
+        update_brick_mesh(obj.data, props, old_rows, old_cols)
+
+    # Colour-only changes skip geometry entirely
+    update_material(obj, props)
+    obj["brick_layout"] = layout
+    return True
+
+
+def create_instanced_wall(context, props):
+    """Creates a point cloud wall that instances one shared brick"""
+    prototype, proto_mesh = replace_output(context, "BrickPrototype", "BrickPrototypeMesh", GENERATOR)
+    build_brick_prototype(proto_mesh, props)
+    apply_material(prototype, props)
+
+    obj, points_mesh = replace_output(context, "BrickWall", "BrickWallPoints", GENERATOR)
+    points_mesh.materials.clear()
+    build_brick_points(points_mesh, props)
+
+    # Keep the prototype with the wall but out of sight
+    prototype.parent = obj
+    prototype.hide_set(True)
+    prototype.hide_render = True
+
+    instancer = obj.modifiers.get("BrickInstances") or obj.modifiers.new(name="BrickInstances", type='NODES')
+    instancer.node_group = brick_instancer_node_group(prototype)
+    return obj
+
+
+def apply_material(obj, props):
+    """Assigns the shared brick and mortar materials to the wall's two slots"""
+    materials = obj.data.materials
+    brick = cached_material("BrickMaterial", props.brick_color)
+    mortar = cached_material("MortarMaterial", props.mortar_color)
+
+    if len(materials) == 2:
+        materials[0] = brick
+        materials[1] = mortar
+    else:
+        materials.clear()
+        materials.append(brick)
+        materials.append(mortar)
+
+    remove_orphan_materials()
+
+
+def update_material(obj, props):
+    """Re-applies the materials after a colour change"""
+    prototype = bpy.data.objects.get("BrickPrototype")
+    if obj.modifiers.get("BrickInstances") and prototype:
+        obj = prototype
+    apply_material(obj, props)
+
+
+# Live preview: property edits show one box per course straight away and the
+# full brick geometry is built once no edit has arrived for LIVE_UPDATE_DELAY.
+LIVE_UPDATE_DELAY = 0.35  # Seconds
+PREVIEW_SAMPLES = 8  # Columns sampled per course for the preview boxes
+_live_update_state = {"last_edit": 0.0}
+
+
+def course_boxes(props):
+    """Returns (verts, faces) arrays with one bounding box per course"""
+    rows, cols = wall_grid(props)
+    sample_cols = np.unique(np.linspace(0, cols - 1, min(cols, PREVIEW_SAMPLES)).astype(int))
+    index = (np.arange(rows)[:, None] * cols + sample_cols[None, :]).ravel()
+
+    corners = brick_corners(props, rows, cols, index).reshape(rows, -1, 3)
+    low = corners.min(axis=1)
+    high = corners.max(axis=1)
+    return kernel.box_arrays(low, high - low)
+
+
+def show_course_preview(context, props):
+    """Shows the cheap per-course proxy in place of the brick wall"""
+    preview = bpy.data.objects.get("BrickWallPreview")
+    if preview is None:
+        preview = bpy.data.objects.new("BrickWallPreview", bpy.data.meshes.new("BrickWallPreviewMesh"))
+        preview.display_type = 'WIRE'
+        preview.hide_render = True
+        context.collection.objects.link(preview)
+
+    preview.data.clear_geometry()
+    rows, cols = wall_grid(props)
+    if rows and cols:
+        verts, faces = course_boxes(props)
+        write_mesh_data(preview.data, verts, faces)
+
+    wall = bpy.data.objects.get("BrickWall")
+    if wall:
+        wall.hide_viewport = True
+
+
+def remove_course_preview():
+    preview = bpy.data.objects.get("BrickWallPreview")
+    if preview:
+        mesh = preview.data
+        bpy.data.objects.remove(preview, do_unlink=True)
+        bpy.data.meshes.remove(mesh)
+
+    wall = bpy.data.objects.get("BrickWall")
+    if wall:
+        wall.hide_viewport = False
+
+
+def finish_live_update():
+    """Timer callback: builds the full wall once edits have settled"""
+    remaining = LIVE_UPDATE_DELAY - (time.monotonic() - _live_update_state["last_edit"])
+    if remaining > 0:
+        return remaining  # Still dragging, check again later
+
+    context = bpy.context
+    remove_course_preview()
+    create_brick_wall(context, context.scene.parametric_brick_wall)
+    return None
+
+
+def update_live_geometry(self, context):
+    """Property update callback for parameters that change the geometry"""
+    if not self.live_update:
+        return
+
+    _live_update_state["last_edit"] = time.monotonic()
+    if np is not None:
+        show_course_preview(context, self)
+    if not bpy.app.timers.is_registered(finish_live_update):
+        bpy.app.timers.register(finish_live_update, first_interval=LIVE_UPDATE_DELAY)
+
+
+def update_live_color(self, context):
+    """Property update callback for colours, which never touch the geometry"""
+    wall = bpy.data.objects.get("BrickWall")
+    if self.live_update and wall:
+        update_material(wall, self)
+
+
+class ParametricBrickWallProperties(bpy.types.PropertyGroup):
+    wall_length: FloatProperty(name="Wall Length", default=5.0, min=0.5, update=update_live_geometry)
+    wall_height: FloatProperty(name="Wall Height", default=5.0, min=0.5, update=update_live_geometry)
+    brick_width: FloatProperty(name="Brick Width", default=0.7, min=0.1, update=update_live_geometry)
+    brick_height: FloatProperty(name="Brick Height", default=0.35, min=0.1, update=update_live_geometry)
+    brick_depth: FloatProperty(name="Brick Depth", default=0.3, min=0.1, update=update_live_geometry)
+    brick_gap: FloatProperty(name="Brick Gap (Mortar)", default=0.05, min=0.0, update=update_live_geometry)
+    stagger_rows: BoolProperty(name="Stagger Rows", default=True, update=update_live_geometry)
+    output_mode: EnumProperty(
+        name="Output",
+        items=[
+            ('MESH', "Mesh", "Write every brick as unique geometry"),
+            ('INSTANCED', "Instanced", "Instance one shared brick on a point cloud"),
+        ],
+        default='MESH',
+        update=update_live_geometry,
+    )
+    live_update: BoolProperty(
+        name="Live Update", default=False,
+        description="Preview the wall while editing and rebuild it once edits settle"
+    )
+    
+    # New Features
+    curved_wall: BoolProperty(name="Curved Wall", default=False, update=update_live_geometry)
+    wall_radius: FloatProperty(name="Wall Radius", default=3.0, min=1.0, update=update_live_geometry)
+    angled_wall: BoolProperty(name="Angled Wall", default=False, update=update_live_geometry)
+    wall_angle: FloatProperty(name="Wall Angle (°)", default=0.0, min=-45.0, max=45.0, update=update_live_geometry)
+    
+    # Materials
+    brick_color: FloatVectorProperty(
+        name="Brick Color", subtype="COLOR", default=(0.6, 0.2, 0.1, 1), min=0, max=1, size=4,
+        update=update_live_color
+    )
+    mortar_color: FloatVectorProperty(
+        name="Mortar Color", subtype="COLOR", default=(0.8, 0.8, 0.8, 1), min=0, max=1, size=4,
+        update=update_live_color
+    )
+
+
+class ParametricBrickWallOperator(bpy.types.Operator):
+    bl_idname = "mesh.parametric_brick_wall"
+    bl_label = "Generate Brick Wall"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.parametric_brick_wall
+        remove_course_preview()
+        create_brick_wall(context, props)
+        return {'FINISHED'}
+
+
+class RealizeBrickWallOperator(bpy.types.Operator):
+    bl_idname = "mesh.realize_brick_wall"
+    bl_label = "Realize Brick Wall"
+    bl_description = "Convert an instanced brick wall into real geometry for export"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = bpy.data.objects.get("BrickWall")
+        return obj is not None and obj.modifiers.get("BrickInstances") is not None
+
+    def execute(self, context):
+        obj = bpy.data.objects["BrickWall"]
+        prototype = bpy.data.objects.get("BrickPrototype")
+        if np is None or prototype is None:
+            self.report({'ERROR'}, "Realize needs NumPy and the BrickPrototype object")
+            return {'CANCELLED'}
+
+        points_mesh = obj.data
+        obj.data = realize_brick_instances(obj, prototype)
+        obj.modifiers.remove(obj.modifiers["BrickInstances"])
+        if "brick_layout" in obj:
+            del obj["brick_layout"]
+        record_reclaimed(GENERATOR, mesh_bytes(points_mesh))
+        bpy.data.meshes.remove(points_mesh)
+
+        remove_output("BrickPrototype", GENERATOR)
+        return {'FINISHED'}
+
+
+class ParametricBrickWallPanel(bpy.types.Panel):
+    bl_label = "Parametric Brick Wall"
+    bl_idname = "VIEW3D_PT_parametric_brick_wall"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Parametric Wall"
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.parametric_brick_wall
+
+        layout.prop(props, "wall_length")
+        layout.prop(props, "wall_height")
+        layout.prop(props, "brick_width")
+        layout.prop(props, "brick_height")
+        layout.prop(props, "brick_depth")
+        layout.prop(props, "brick_gap")
+        layout.prop(props, "stagger_rows")
+        layout.prop(props, "output_mode")
+
+        layout.separator()
+        layout.prop(props, "curved_wall")
+        if props.curved_wall:
+            layout.prop(props, "wall_radius")
+
+        layout.prop(props, "angled_wall")
+        if props.angled_wall:
+            layout.prop(props, "wall_angle")
+
+        layout.separator()
+        layout.prop(props, "brick_color")
+        layout.prop(props, "mortar_color")
+
+        layout.prop(props, "live_update")
+        layout.operator("mesh.parametric_brick_wall", text="Generate Brick Wall")
+        if props.output_mode == 'INSTANCED':
+            layout.operator("mesh.realize_brick_wall", text="Realize Bricks")
+
+
+classes = [
+    ParametricBrickWallProperties,
+    ParametricBrickWallOperator,
+    RealizeBrickWallOperator,
+    ParametricBrickWallPanel
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.parametric_brick_wall = bpy.props.PointerProperty(type=ParametricBrickWallProperties)
+
+
+def unregister():
+    if bpy.app.timers.is_registered(finish_live_update):
+        bpy.app.timers.unregister(finish_live_update)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.parametric_brick_wall
@@ -0,0 +1,538 @@
+# Section 0 - Canvas Gen
+# Four anchor points define a plane. The plane then has cloth settings
+# applied and the 4 corners of the plane are pinned in place.
+
+# Section 1 - Imports
+import bpy
+import hashlib
+import json
+import os
+from bpy.props import FloatProperty, IntProperty, PointerProperty, BoolProperty, EnumProperty
+
+from . import kernel, lazy_import
+from .mesh_utils import remove_output, write_mesh_data
+
+np = lazy_import("numpy")  # None falls back to building the grid from Python lists
+
+GENERATOR = "Canvas"
+
+#Section 2 - File Path for Presets
+PRESET_FILE_PATH = os.path.join(bpy.utils.user_resource('CONFIG'), "cloth_presets.json")
+PRESET_DB_PATH = os.path.join(bpy.utils.user_resource('CONFIG'), "cloth_presets.db")
+
+# Settled canvas shapes, one .npy per cloth configuration
+SHAPE_CACHE_DIR = os.path.join(bpy.utils.user_resource('DATAFILES'), "canvas_shapes")
+SHAPE_CACHE_LIMIT = 256 * 1024 * 1024  # Bytes kept on disk before the least recently used shapes go
+
+#Section 3 - Load and Save Presets
+# Presets live in a SQLite database so saving one preset is a single
+# transaction instead of a rewrite of the whole library, and several Blender
+# sessions can share it: each write takes the database lock, waiting up to
+# the timeout for another session's write to finish. The default rollback
+# journal is kept over WAL because the library may sit on a network share.
+# The database is only opened the first time a preset is needed.
+PRESET_FIELDS = ("mass", "bending_stiffness", "air_damping", "self_collision")
+
+_preset_db = None
+_preset_items = []
+_preset_items_version = None
+
+def preset_db():
+    """Opens the preset database on first use, importing the old JSON presets once"""
+    global _preset_db
+    if _preset_db is None:
+        os.makedirs(os.path.dirname(PRESET_DB_PATH), exist_ok=True)
+        import sqlite3
+
+        db = sqlite3.connect(PRESET_DB_PATH, timeout=10.0)
+        with db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS presets ("
+                "name TEXT PRIMARY KEY, mass REAL, bending_stiffness REAL, air_damping REAL, self_collision INTEGER)"
+            )
+            if db.execute("SELECT COUNT(*) FROM presets").fetchone()[0] == 0:
+                for name, preset in load_json_presets().items():
+                    # Presets saved by older versions spelled the collision key "slef_collision"
+                    preset.setdefault("self_collision", preset.get("slef_collision", False))
+                    db.execute("INSERT OR IGNORE INTO presets VALUES (?, ?, ?, ?, ?)", (name, *preset_values(preset)))
+        _preset_db = db
+    return _preset_db
+
+def load_json_presets():
+    """This loads the fabric presets from JSON file."""
+    if not os.path.exists(PRESET_FILE_PATH):
+        return {}
+    
+    with open(PRESET_FILE_PATH, 'r') as file:
+        return json.load(file)
+
+def preset_values(preset):
+    return (
+        float(preset["mass"]), float(preset["bending_stiffness"]), float(preset["air_damping"]),
+        int(bool(preset["self_collision"])),
+    )
+
+def save_preset(name, preset):
+    """Inserts or replaces one preset in a single transaction"""
+    db = preset_db()
+    with db:
+        db.execute("INSERT OR REPLACE INTO presets VALUES (?, ?, ?, ?, ?)", (name, *preset_values(preset)))
+
+def load_preset(name):
+    """Returns the named preset as a dict, or None"""
+    row = preset_db().execute(
+        "SELECT mass, bending_stiffness, air_damping, self_collision FROM presets WHERE name = ?", (name,)
+    ).fetchone()
+    if row is None:
+        return None
+    preset = dict(zip(PRESET_FIELDS, row))
+    preset["self_collision"] = bool(preset["self_collision"])
+    return preset
+
+def preset_items(self, context):
+    """Enum items for the saved presets, rebuilt only when the database changed.
+
+    SQLite bumps data_version whenever any connection, in this session or
+    another, commits a change, so checking it is a single cheap query per
+    redraw. The cached list also keeps the item strings alive, which Blender
+    needs from dynamic enum callbacks.
+    """
+    global _preset_items, _preset_items_version
+    db = preset_db()
+    version = db.execute("PRAGMA data_version").fetchone()[0], db.total_changes
+    if version != _preset_items_version:
+        _preset_items = [(name, name, "") for (name,) in db.execute("SELECT name FROM presets ORDER BY name")]
+        _preset_items_version = version
+    return _preset_items
+
+# Section 4 - Property Group for Vertex Data  
+class AncPoints(bpy.types.PropertyGroup):
+    def update_plane(self, context):
+        create_plane_from_anchors(context)
+
+    def update_anchors(self, context):
+        update_plane_anchors(context)
+    
+    def update_cloth_settings(self, context):
+        obj = bpy.data.objects.get("Canvas1")
+        if obj and obj.modifiers.get("Cloth"):
+            cloth_mod = obj.modifiers["Cloth"]
+            cloth_mod.settings.mass = self.cloth_mass
+            cloth_mod.settings.bending_stiffness = self.cloth_bending_stiffness
+            cloth_mod.settings.air_damping = self.cloth_air_damping
+            cloth_mod.collision_settings.use_self_collision = self.cloth_self_collision
+            show_settled_shape(obj, self, reset=True)
+
+    anc_pointsx_one: FloatProperty(name="Define Anchor Points 1 X", default=-1.0, update=update_anchors)
+    anc_pointsy_one: FloatProperty(name="Define Anchor Points 1 Y", default=-1.0, update=update_anchors)
+    anc_pointsz_one: FloatProperty(name="Define Anchor Points 1 Z", default=0.0, update=update_anchors)
+
+    anc_pointsx_two: FloatProperty(name="Define Anchor Points 2 X", default=1.0, update=update_anchors)
+    anc_pointsy_two: FloatProperty(name="Define Anchor Points 2 Y", default=-1.0, update=update_anchors)
+    anc_pointsz_two: FloatProperty(name="Define Anchor Points 2 Z", default=0.0, update=update_anchors)
+
+    anc_pointsx_three: FloatProperty(name="Define Anchor Points 3 X", default=1.0, update=update_anchors)
+    anc_pointsy_three: FloatProperty(name="Define Anchor Points 3 Y", default=1.0, update=update_anchors)
+    anc_pointsz_three: FloatProperty(name="Define Anchor Points 3 Z", default=0.0, update=update_anchors)
+
+    anc_pointsx_four: FloatProperty(name="Define Anchor Points 4 X", default=-1.0, update=update_anchors)
+    anc_pointsy_four: FloatProperty(name="Define Anchor Points 4 Y", default=1.0, update=update_anchors)
+    anc_pointsz_four: FloatProperty(name="Define Anchor Points 4 Z", default=0.0, update=update_anchors)
+
+    subdivision: IntProperty(name="Subdivision Levels", default=10, min=0, max=100, update=update_plane)
+
+    cloth_mass: FloatProperty(name="Cloth Mass", default=1.0, min=0.1, max=10.0, update=update_cloth_settings)
+    cloth_bending_stiffness: FloatProperty(name="Bending Stiffness", default=0.5, min=0.0, max=1.0, update=update_cloth_settings)
+    cloth_air_damping: FloatProperty(name="Air Damping", default=5.0, min=0.0, max=10.0, update=update_cloth_settings)
+    cloth_self_collision: BoolProperty(name="Enable Self Collision", default=False, update=update_cloth_settings)
+
+    preset_name: bpy.props.StringProperty(name="Preset Name", default="NewPreset")
+    available_presets: EnumProperty(
+        name="Saved Presets",
+        items=preset_items,
+        description="Select a preset to load"
+    )
+
+# Section 5 - Operator to Save Presets
+class MESH_OT_save_preset(bpy.types.Operator):
+    bl_idname = "mesh.save_preset"
+    bl_label = "Save Preset"
+    bl_description = "Save the current cloth settings as a preset"
+
+    def execute(self, context):
+        props = context.scene.v_props
+        save_preset(props.preset_name, {
+            "mass": props.cloth_mass,
+            "bending_stiffness": props.cloth_bending_stiffness,
+            "air_damping": props.cloth_air_damping,
+            "self_collision": props.cloth_self_collision
+        })
+        return {'FINISHED'}
+
+# Section 6 - Operator to Load Presets
+class MESH_OT_load_preset(bpy.types.Operator):
+    bl_idname = "mesh.load_preset"
+    bl_label = "Load Preset"
+    bl_description = "Loads a saved fabric preset"
+
+    def execute(self, context):
+        props = context.scene.v_props
+        preset_data = load_preset(props.available_presets)
+        if preset_data:
+            props.cloth_mass = preset_data["mass"]
+            props.cloth_bending_stiffness = preset_data["bending_stiffness"]
+            props.cloth_air_damping = preset_data["air_damping"]
+            props.cloth_self_collision = preset_data["self_collision"]
+        return {'FINISHED'}
+
+# Section 7 - Function to Create Plane from Anchor Points and Applys Cloth and Pin Settings
+def anchor_points(props):
+    """Returns the four anchors in order, as (x, y, z) tuples"""
+    return [
+        (props.anc_pointsx_one, props.anc_pointsy_one, props.anc_pointsz_one),
+        (props.anc_pointsx_two, props.anc_pointsy_two, props.anc_pointsz_two),
+        (props.anc_pointsx_three, props.anc_pointsy_three, props.anc_pointsz_three),
+        (props.anc_pointsx_four, props.anc_pointsy_four, props.anc_pointsz_four),
+    ]
+
+def build_canvas_grid(mesh, anchors, cuts):
+    """Fills an empty mesh with the subdivided canvas between the anchors"""
+    if np is not None:
+        write_mesh_data(mesh, kernel.bilinear_grid(anchors, cuts), kernel.grid_faces(cuts))
+        return
+
+    side = cuts + 2
+    a1, a2, a3, a4 = anchors
+    verts = []
+    for j in range(side):
+        v = j / (side - 1)
+        for i in range(side):
+            u = i / (side - 1)
+            verts.append(tuple(
+                (1 - u) * (1 - v) * a1[k] + u * (1 - v) * a2[k] + u * v * a3[k] + (1 - u) * v * a4[k]
+                for k in range(3)
+            ))
+    faces = [
+        (j * side + i, j * side + i + 1, (j + 1) * side + i + 1, (j + 1) * side + i)
+        for j in range(side - 1) for i in range(side - 1)
+    ]
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+
+def create_plane_from_anchors(context):
+    props = context.scene.v_props
+    obj_name = "Canvas1"
+
+    remove_output(obj_name, GENERATOR)
+
+    mesh = bpy.data.meshes.new(name=obj_name)
+    obj = bpy.data.objects.new(name=obj_name, object_data=mesh)
+    context.collection.objects.link(obj)
+    context.view_layer.objects.active = obj
+    obj.select_set(True)
+
+    # Build the subdivided grid directly, no edit-mode round trip
+    build_canvas_grid(mesh, anchor_points(props), props.subdivision)
+    
+    vg_corners = obj.vertex_groups.new(name="Corners")
+
+    corner_indices = kernel.grid_corner_indices(props.subdivision)
+    vg_corners.add(corner_indices, 1.0, 'REPLACE')
+
+    cloth_mod = obj.modifiers.new(name="Cloth", type='CLOTH')
+    cloth_mod.settings.vertex_group_mass = vg_corners.name
+    cloth_mod.settings.mass = props.cloth_mass
+    cloth_mod.settings.bending_stiffness = props.cloth_bending_stiffness
+    cloth_mod.settings.air_damping = props.cloth_air_damping
+    cloth_mod.collision_settings.use_self_collision = props.cloth_self_collision
+
+    show_settled_shape(obj, props)
+
+def update_plane_anchors(context):
+    """Moves the existing canvas to new anchor positions without rebuilding it.
+
+    Only the vertex coordinates are rewritten, in one bulk set, so the
+    object, its Corners group and Cloth modifier are kept. Falls back to a
+    full rebuild when the canvas is missing or its subdivision changed.
+    """
+    props = context.scene.v_props
+    obj = bpy.data.objects.get("Canvas1")
+    side = props.subdivision + 2
+    if np is None or obj is None or obj.type != 'MESH' or len(obj.data.vertices) != side * side:
+        create_plane_from_anchors(context)
+        return
+
+    mesh = obj.data
+    coords = kernel.bilinear_grid(anchor_points(props), props.subdivision)
+    mesh.vertices.foreach_set("co", coords.astype(np.float32).ravel())
+    mesh.update()
+    show_settled_shape(obj, props)
+
+class MESH_OT_create_plane_from_anchors(bpy.types.Operator):
+    bl_idname = "mesh.create_plane_from_anchors"
+    bl_label = "Generate Canvas"
+    bl_description = "Creates a cloth-simulated plane using four defined points"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        create_plane_from_anchors(context)
+        return {'FINISHED'}
+
+# Section 7b - Form Finding Without the Cloth Simulation
+# The settled shape is solved directly with the force density method in
+# kernel.form_find, with the Corners group pinned.
+def pinned_vertices(obj, group_name):
+    """Indices of the vertices assigned to a vertex group"""
+    group = obj.vertex_groups.get(group_name)
+    if group is None:
+        return []
+    return [v.index for v in obj.data.vertices if any(g.group == group.index for g in v.groups)]
+
+class MESH_OT_form_find_canvas(bpy.types.Operator):
+    bl_idname = "mesh.form_find_canvas"
+    bl_label = "Form-find"
+    bl_description = "Solve the settled canvas shape directly instead of simulating the cloth frame by frame"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    tension: FloatProperty(name="Tension", description="Fabric prestress in N/m", default=1.0, min=0.001)
+    fabric_weight: FloatProperty(name="Fabric Weight", description="Fabric self weight in N/m²", default=1.0, min=0.0)
+
+    def execute(self, context):
+        obj = bpy.data.objects.get("Canvas1")
+        if obj is None or np is None:
+            self.report({'ERROR'}, "Form-find needs NumPy and a generated canvas")
+            return {'CANCELLED'}
+
+        mesh = obj.data
+        pinned = pinned_vertices(obj, "Corners")
+        if not pinned:
+            self.report({'ERROR'}, "The canvas has no pinned Corners vertices")
+            return {'CANCELLED'}
+
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        areas = np.empty(len(mesh.polygons), dtype=np.float32)
+        mesh.polygons.foreach_get("area", areas)
+
+        # Spread the fabric weight evenly over the nodes
+        loads = np.zeros((len(mesh.vertices), 3))
+        loads[:, 2] = -self.fabric_weight * areas.sum() / len(mesh.vertices)
+
+        try:
+            coords, iterations = kernel.form_find(coords.reshape(-1, 3), edges.reshape(-1, 2), pinned, self.tension, loads)
+        except ValueError as error:
+            self.report({'ERROR'}, f"Cannot form-find {obj.name}: {error}")
+            return {'CANCELLED'}
+        mesh.vertices.foreach_set("co", coords.astype(np.float32).ravel())
+        mesh.update()
+
+        self.report({'INFO'}, f"Form found in {iterations} iterations")
+        return {'FINISHED'}
+
+# Section 7c - Settled Shape Cache
+# The cloth simulation always starts cold from frame 1. Once a configuration
+# has settled, its final vertex array is kept on disk under a hash of
+# everything that shapes it, so coming back to it is a file load. A file's
+# modification time marks its last use, and the oldest go first when the
+# cache outgrows SHAPE_CACHE_LIMIT.
+def shape_cache_key(props):
+    """Hash of the anchors, subdivision and cloth settings"""
+    params = {
+        "anchors": [[round(c, 6) for c in anchor] for anchor in anchor_points(props)],
+        "subdivision": props.subdivision,
+        "mass": round(props.cloth_mass, 6),
+        "bending_stiffness": round(props.cloth_bending_stiffness, 6),
+        "air_damping": round(props.cloth_air_damping, 6),
+        "self_collision": props.cloth_self_collision,
+    }
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+def shape_cache_path(key):
+    return os.path.join(SHAPE_CACHE_DIR, key + ".npy")
+
+def load_settled_shape(key, n_verts):
+    """Returns the cached (n_verts, 3) coords memory-mapped from disk, or None"""
+    path = shape_cache_path(key)
+    try:
+        coords = np.load(path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    if coords.shape != (n_verts, 3):
+        return None
+    os.utime(path)  # Mark as recently used
+    return coords
+
+def store_settled_shape(key, coords):
+    os.makedirs(SHAPE_CACHE_DIR, exist_ok=True)
+    path = shape_cache_path(key)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as file:
+        np.save(file, np.asarray(coords, dtype=np.float32))
+    os.replace(temp_path, path)
+    evict_settled_shapes()
+
+def evict_settled_shapes(limit=SHAPE_CACHE_LIMIT):
+    """Deletes the least recently used shapes until the cache fits the limit"""
+    entries = []
+    for entry in os.scandir(SHAPE_CACHE_DIR):
+        if entry.name.endswith(".npy"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        os.remove(path)
+        total -= size
+
+def show_settled_shape(obj, props, reset=False):
+    """Puts the cached settled shape on the canvas, or hands it to the cloth sim.
+
+    On a hit the coords are written to the mesh and the Cloth modifier is
+    switched off. On a miss the modifier is switched back on; with reset the
+    flat grid is restored first, in case a cached shape is still showing.
+    Returns True on a hit.
+    """
+    if np is None:
+        return False
+
+    mesh = obj.data
+    coords = load_settled_shape(shape_cache_key(props), len(mesh.vertices))
+    if coords is None and reset:
+        coords_to_show = kernel.bilinear_grid(anchor_points(props), props.subdivision)
+    else:
+        coords_to_show = coords
+    if coords_to_show is not None:
+        mesh.vertices.foreach_set("co", np.asarray(coords_to_show, dtype=np.float32).ravel())
+        mesh.update()
+
+    cloth_mod = obj.modifiers.get("Cloth")
+    if cloth_mod:
+        cloth_mod.show_viewport = cloth_mod.show_render = coords is None
+    return coords is not None
+
+class MESH_OT_cache_canvas_shape(bpy.types.Operator):
+    bl_idname = "mesh.cache_canvas_shape"
+    bl_label = "Settle and Cache"
+    bl_description = "Simulate the cloth to the end of its cache range and keep the settled shape for these settings"
+
+    def execute(self, context):
+        props = context.scene.v_props
+        obj = bpy.data.objects.get("Canvas1")
+        if obj is None or np is None:
+            self.report({'ERROR'}, "Caching needs NumPy and a generated canvas")
+            return {'CANCELLED'}
+
+        key = shape_cache_key(props)
+        if show_settled_shape(obj, props):
+            self.report({'INFO'}, "Settled shape loaded from the cache")
+            return {'FINISHED'}
+
+        cloth_mod = obj.modifiers.get("Cloth")
+        if cloth_mod is None:
+            self.report({'ERROR'}, "The canvas has no Cloth modifier")
+            return {'CANCELLED'}
+
+        # Cloth only steps forward one frame at a time, so play the range through
+        scene = context.scene
+        current_frame = scene.frame_current
+        point_cache = cloth_mod.point_cache
+        for frame in range(point_cache.frame_start, point_cache.frame_end + 1):
+            scene.frame_set(frame)
+
+        evaluated = obj.evaluated_get(context.evaluated_depsgraph_get())
+        settled = evaluated.to_mesh()
+        coords = np.empty(len(settled.vertices) * 3, dtype=np.float32)
+        settled.vertices.foreach_get("co", coords)
+        evaluated.to_mesh_clear()
+        scene.frame_set(current_frame)
+
+        store_settled_shape(key, coords.reshape(-1, 3))
+        show_settled_shape(obj, props)
+        self.report({'INFO'}, f"Settled shape cached at frame {point_cache.frame_end}")
+        return {'FINISHED'}
+
+# Section 4 - UI Panel
+class AncToPlane_Panel(bpy.types.Panel):
+    bl_label = "Create Plane from Defined Points"
+    bl_idname = "VIEW3D_PT_anc_plane"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Vert to Plane"
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+
+        layout.label(text="Define Plane Verticies:")
+        
+        split = layout.split()
+
+        col = split.column(align=True)
+        col.label(text="Anchor 1")
+        col.prop(scene.v_props, "anc_pointsx_one")
+        col.prop(scene.v_props, "anc_pointsy_one")
+        col.prop(scene.v_props, "anc_pointsz_one")
+
+        col = split.column(align=True)
+        col.label(text="Anchor 2")
+        col.prop(scene.v_props, "anc_pointsx_two")
+        col.prop(scene.v_props, "anc_pointsy_two")
+        col.prop(scene.v_props, "anc_pointsz_two")
+
+        col = split.column(align=True)
+        col.label(text="Anchor 3")
+        col.prop(scene.v_props, "anc_pointsx_three")
+        col.prop(scene.v_props, "anc_pointsy_three")
+        col.prop(scene.v_props, "anc_pointsz_three")
+
+        col = split.column(align=True)
+        col.label(text="Anchor 4")
+        col.prop(scene.v_props, "anc_pointsx_four")
+        col.prop(scene.v_props, "anc_pointsy_four")
+        col.prop(scene.v_props, "anc_pointsz_four")
+
+        box = layout.box()
+        box.label(text="Subdivisions")
+        box.prop(scene.v_props, "subdivision")
+
+        box = layout.box()
+        box.label(text="Cloth Settings")
+        box.prop(scene.v_props, "cloth_mass")
+        box.prop(scene.v_props, "cloth_bending_stiffness")
+        box.prop(scene.v_props, "cloth_air_damping")
+        box.prop(scene.v_props, "cloth_self_collision")
+        box.operator("mesh.form_find_canvas")
+        box.operator("mesh.cache_canvas_shape")
+
+        box = layout.box()
+        box.label(text="Fabric Presets")
+        box.prop(scene.v_props, "preset_name")
+        box.operator("mesh.save_preset")
+        box.prop(scene.v_props, "available_presets")
+        box.operator("mesh.load_preset")
+
+        layout.operator("mesh.create_plane_from_anchors")
+
+# Section 8 - Registration
+classes = [
+    AncPoints, MESH_OT_save_preset, MESH_OT_load_preset, MESH_OT_create_plane_from_anchors,
+    MESH_OT_form_find_canvas, MESH_OT_cache_canvas_shape, AncToPlane_Panel
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.v_props = bpy.props.PointerProperty(type=AncPoints)
+
+def unregister():
+    global _preset_db, _preset_items_version
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.v_props
+    if _preset_db is not None:
+        _preset_db.close()
+        _preset_db, _preset_items_version = None, None
@@ -0,0 +1,463 @@
+# Curtain Wall Generator: generates a parametric curtain wall with
+# adjustable settings, one facade at a time or in batches from a spec file.
+
+import bpy
+import bmesh
+import csv
+import json
+import math
+import os
+
+from . import lazy_import
+from .kernel import curtain_wall_lattice, group_panels, panel_kinds, panel_schedule, panel_size
+from .mesh_utils import remove_output, replace_output, write_mesh_data
+
+np = lazy_import("numpy")  # None falls back to the per-mullion BMesh loop
+
+GENERATOR = "Curtain Wall"
+
+class CurtainWallProperties(bpy.types.PropertyGroup):
+    width: bpy.props.FloatProperty(name="Width", default=5.0, min=1.0, description="Total width of the curtain wall")
+    height: bpy.props.FloatProperty(name="Height", default=10.0, min=1.0, description="Total height of the curtain wall")
+    columns: bpy.props.IntProperty(name="Columns", default=5, min=1, description="Number of panel columns")
+    rows: bpy.props.IntProperty(name="Rows", default=5, min=1, description="Number of panel rows")
+    mullion_thickness: bpy.props.FloatProperty(name="Mullion Thickness", default=0.1, min=0.01, description="Thickness of mullions")
+    mullion_depth: bpy.props.FloatProperty(name="Mullion Depth", default=0.1, min=0.01, description="Depth of mullions")
+    spandrel_interval: bpy.props.IntProperty(name="Spandrel Every N Rows", default=0, min=0, description="Make every Nth row of panels an opaque spandrel (0 for none)")
+    panel_output: bpy.props.EnumProperty(
+        name="Panels",
+        items=[
+            ('MESH', "Mesh", "Write every panel as its own quad"),
+            ('INSTANCED', "Instanced", "Instance one prototype per panel type"),
+        ],
+        default='MESH',
+    )
+    facade_spec: bpy.props.StringProperty(name="Facade Spec", subtype='FILE_PATH', description="JSON or CSV file listing the facades to build")
+    batch_workers: bpy.props.IntProperty(name="Workers", default=0, min=0, description="Threads used to compute facades (0 for one per core)")
+
+def build_curtain_wall_numpy(panel_mesh, mullion_mesh, width, height, columns, rows, mullion_thickness, mullion_depth):
+    """Builds the welded frame and the panels as arrays and writes both meshes in bulk"""
+    frame_verts, frame_faces, panel_verts, panel_faces = curtain_wall_lattice(
+        width, height, columns, rows, mullion_thickness, mullion_depth
+    )
+    write_mesh_data(mullion_mesh, frame_verts, frame_faces)
+    write_mesh_data(panel_mesh, panel_verts, panel_faces)
+
+def build_curtain_wall_bmesh(panel_mesh, mullion_mesh, width, height, columns, rows, mullion_thickness, mullion_depth):
+    """Pure-Python fallback: one BMesh box per mullion and one quad per panel"""
+    panel_width, panel_height = panel_size(width, height, columns, rows, mullion_thickness)
+
+    # Create BMesh objects
+    panel_bm = bmesh.new()
+    mullion_bm = bmesh.new()
+
+    for col in range(columns + 1):  # Add extra column for closing the frame
+        for row in range(rows + 1):  # Add extra row for closing the frame
+            x_offset = col * (panel_width + mullion_thickness)
+            z_offset = row * (panel_height + mullion_thickness)
+
+            # Create Panel (Skip last row/column since it's only for mullions),
+            # inside the opening past its mullion like the NumPy lattice
+            if col < columns and row < rows:
+                panel_x = x_offset + mullion_thickness
+                panel_z = z_offset + mullion_thickness
+                panel_verts = [
+                    (panel_x, 0, panel_z),
+                    (panel_x + panel_width, 0, panel_z),
+                    (panel_x + panel_width, 0, panel_z + panel_height),
+                    (panel_x, 0, panel_z + panel_height)
+                ]
+                panel_faces = [panel_bm.verts.new(v) for v in panel_verts]
+                panel_bm.faces.new(panel_faces)
+
+            # Create Vertical Mullions
+            mullion_verts = [
+                (x_offset, 0, z_offset - mullion_thickness),  
+                (x_offset + mullion_thickness, 0, z_offset - mullion_thickness),
+                (x_offset + mullion_thickness, 0, z_offset + panel_height + mullion_thickness),
+                (x_offset, 0, z_offset + panel_height + mullion_thickness),
+
+                (x_offset, -mullion_depth, z_offset - mullion_thickness),
+                (x_offset + mullion_thickness, -mullion_depth, z_offset - mullion_thickness),
+                (x_offset + mullion_thickness, -mullion_depth, z_offset + panel_height + mullion_thickness),
+                (x_offset, -mullion_depth, z_offset + panel_height + mullion_thickness)
+            ]
+            mullion_faces = [[0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7], [4, 5, 6, 7], [0, 1, 2, 3]]
+            mullion_verts = [mullion_bm.verts.new(v) for v in mullion_verts]
+            for face in mullion_faces:
+                mullion_bm.faces.new([mullion_verts[i] for i in face])
+
+    # Generate meshes
+    panel_bm.to_mesh(panel_mesh)
+    mullion_bm.to_mesh(mullion_mesh)
+
+    # Free BMesh data
+    panel_bm.free()
+    mullion_bm.free()
+
+def panel_instancer_node_group(collection, name="CurtainWall"):
+    """Returns the geometry node group that places one panel type on every point"""
+    group = bpy.data.node_groups.get(f"{name}_PanelInstancer")
+    if group is None:
+        group = bpy.data.node_groups.new(f"{name}_PanelInstancer", 'GeometryNodeTree')
+        group.interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        group.interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+        nodes = group.nodes
+        links = group.links
+        group_in = nodes.new("NodeGroupInput")
+        group_out = nodes.new("NodeGroupOutput")
+        panel_types = nodes.new("GeometryNodeCollectionInfo")
+        panel_types.name = "Panel Types"
+        panel_types.inputs["Separate Children"].default_value = True
+        panel_types.inputs["Reset Children"].default_value = True
+        panel_type = nodes.new("GeometryNodeInputNamedAttribute")
+        panel_type.data_type = 'INT'
+        panel_type.inputs["Name"].default_value = "panel_type"
+        instance = nodes.new("GeometryNodeInstanceOnPoints")
+        instance.inputs["Pick Instance"].default_value = True
+
+        links.new(group_in.outputs["Geometry"], instance.inputs["Points"])
+        links.new(panel_types.outputs["Instances"], instance.inputs["Instance"])
+        links.new(panel_type.outputs["Attribute"], instance.inputs["Instance Index"])
+        links.new(instance.outputs["Instances"], group_out.inputs["Geometry"])
+
+    group.nodes["Panel Types"].inputs["Collection"].default_value = collection
+    return group
+
+def build_panel_instances(panel_obj, panel_mesh, prototypes, instance_type, origins, name="CurtainWall"):
+    """Writes one point per panel and instances a shared quad per panel type on them.
+
+    The prototypes live in the <name>_PanelTypes collection, ordered by
+    name to match the "panel_type" index; replacing a prototype's mesh swaps
+    that panel type on every instance. Prototypes are matched to the panel
+    types by size and kind on every run, so a type that still exists keeps
+    its object, and any mesh swapped in by hand, even when its index moves.
+    """
+    collection = bpy.data.collections.get(f"{name}_PanelTypes")
+    if collection is None:
+        collection = bpy.data.collections.new(f"{name}_PanelTypes")
+
+    existing = {}
+    for obj in list(collection.objects):
+        key = (obj.get("panel_width"), obj.get("panel_height"), obj.get("panel_kind"))
+        if key in existing or None in key:
+            remove_output(obj.name, GENERATOR)
+        else:
+            existing[key] = obj
+    kept = [existing.pop(prototype, None) for prototype in prototypes]
+    for obj in existing.values():
+        remove_output(obj.name, GENERATOR)  # Panel types the wall no longer has
+
+    # Move kept prototypes out of the way first, so their new names are free
+    for index, obj in enumerate(kept):
+        if obj is not None:
+            obj.name = f"{name}_PanelType_{index:03d}_Kept"
+
+    for index, ((width, height, kind), obj) in enumerate(zip(prototypes, kept)):
+        if obj is None:
+            mesh = bpy.data.meshes.new(f"{name}_PanelType_{index:03d}_Mesh")
+            mesh.from_pydata([(0, 0, 0), (width, 0, 0), (width, 0, height), (0, 0, height)], [], [(0, 1, 2, 3)])
+            obj = bpy.data.objects.new(f"{name}_PanelType_{index:03d}", mesh)
+            obj["panel_width"], obj["panel_height"], obj["panel_kind"] = width, height, kind
+            collection.objects.link(obj)
+        obj.name = f"{name}_PanelType_{index:03d}"
+
+    panel_mesh.vertices.add(len(origins))
+    panel_mesh.vertices.foreach_set("co", origins.astype(np.float32).ravel())
+    panel_mesh.attributes.new("panel_type", 'INT', 'POINT').data.foreach_set("value", instance_type.astype(np.int32))
+    panel_mesh.update()
+
+    instancer = panel_obj.modifiers.get("PanelInstances") or panel_obj.modifiers.new(name="PanelInstances", type='NODES')
+    instancer.node_group = panel_instancer_node_group(collection, name)
+
+def curtain_wall_arrays(width, height, columns, rows, mullion_thickness, mullion_depth, spandrel_interval=0):
+    """Computes every array of a curtain wall without touching bpy.
+
+    Safe to run on a worker thread. Returns None when the panels would have
+    no size.
+    """
+    panel_width, panel_height = panel_size(width, height, columns, rows, mullion_thickness)
+    if panel_width <= 0 or panel_height <= 0:
+        return None
+
+    frame_verts, frame_faces, panel_verts, panel_faces = curtain_wall_lattice(
+        width, height, columns, rows, mullion_thickness, mullion_depth
+    )
+    prototypes, instance_type, origins = group_panels(panel_verts, panel_kinds(columns, rows, spandrel_interval))
+    return {
+        "frame_verts": frame_verts,
+        "frame_faces": frame_faces,
+        "panel_verts": panel_verts,
+        "panel_faces": panel_faces,
+        "prototypes": prototypes,
+        "instance_type": instance_type,
+        "origins": origins,
+    }
+
+def write_curtain_wall(context, name, arrays, panel_output='MESH', collection=None):
+    """Writes the arrays from curtain_wall_arrays into the <name>_Panels and <name>_Mullions objects"""
+    panel_obj, panel_mesh = replace_output(context, f"{name}_Panels", f"{name}_Panels_Mesh", GENERATOR, collection)
+    mullion_obj, mullion_mesh = replace_output(context, f"{name}_Mullions", f"{name}_Mullions_Mesh", GENERATOR, collection)
+
+    write_mesh_data(mullion_mesh, arrays["frame_verts"], arrays["frame_faces"])
+    panel_obj["panel_schedule"] = panel_schedule(arrays["prototypes"], arrays["instance_type"])
+
+    if panel_output == 'INSTANCED':
+        build_panel_instances(panel_obj, panel_mesh, arrays["prototypes"], arrays["instance_type"], arrays["origins"], name)
+    else:
+        instancer = panel_obj.modifiers.get("PanelInstances")
+        if instancer:
+            panel_obj.modifiers.remove(instancer)
+        write_mesh_data(panel_mesh, arrays["panel_verts"], arrays["panel_faces"])
+
+    return panel_obj, mullion_obj
+
+def create_curtain_wall(width, height, columns, rows, mullion_thickness, mullion_depth, spandrel_interval=0, panel_output='MESH', name="CurtainWall"):
+    """Creates a 3D curtain wall with seamless mullions and panels."""
+
+    # Compute panel and mullion dimensions
+    panel_width, panel_height = panel_size(width, height, columns, rows, mullion_thickness)
+
+    # Ensure dimensions are valid
+    if panel_width <= 0 or panel_height <= 0:
+        print("Error: Panel size is negative. Reduce mullion thickness or columns/rows.")
+        return
+
+    if np is None:
+        # Reuse the old curtain wall objects and meshes in place
+        panel_obj, panel_mesh = replace_output(bpy.context, f"{name}_Panels", f"{name}_Panels_Mesh", GENERATOR)
+        mullion_obj, mullion_mesh = replace_output(bpy.context, f"{name}_Mullions", f"{name}_Mullions_Mesh", GENERATOR)
+        build_curtain_wall_bmesh(panel_mesh, mullion_mesh, width, height, columns, rows, mullion_thickness, mullion_depth)
+        print("Curtain wall created successfully!")
+        return
+
+    arrays = curtain_wall_arrays(width, height, columns, rows, mullion_thickness, mullion_depth, spandrel_interval)
+    write_curtain_wall(bpy.context, name, arrays, panel_output)
+
+    print("Curtain wall created successfully!")
+
+# Batch generation: a facade spec file lists every elevation of a building.
+# JSON files hold a list of objects (or {"facades": [...]}); CSV files have
+# one facade per row with origin_x/origin_y/origin_z columns. Direction is
+# the facade's heading in degrees about Z, or an [x, y] vector in JSON.
+FACADE_DEFAULTS = {
+    "origin": (0.0, 0.0, 0.0),
+    "direction": 0.0,
+    "width": 5.0,
+    "height": 10.0,
+    "columns": 5,
+    "rows": 5,
+    "mullion_thickness": 0.1,
+    "mullion_depth": 0.1,
+    "spandrel_interval": 0,
+    "panel_output": "MESH",
+}
+
+def parse_facade_spec(entry, index):
+    """Returns a complete, typed facade spec from one JSON object or CSV row"""
+    spec = dict(FACADE_DEFAULTS, name=f"Facade_{index + 1:03d}")
+    spec.update({key: value for key, value in entry.items() if value not in (None, "")})
+
+    if "origin_x" in spec:
+        spec["origin"] = (spec.pop("origin_x"), spec.pop("origin_y", 0.0), spec.pop("origin_z", 0.0))
+    spec["origin"] = tuple(float(v) for v in spec["origin"])
+
+    direction = spec["direction"]
+    if isinstance(direction, (list, tuple)):
+        direction = math.degrees(math.atan2(float(direction[1]), float(direction[0])))
+    spec["direction"] = float(direction)
+
+    for key in ["width", "height", "mullion_thickness", "mullion_depth"]:
+        spec[key] = float(spec[key])
+    for key in ["columns", "rows", "spandrel_interval"]:
+        spec[key] = int(spec[key])
+    spec["name"] = str(spec["name"])
+    spec["panel_output"] = str(spec["panel_output"]).upper()
+
+    name = spec["name"]
+    if spec["columns"] < 1 or spec["rows"] < 1:
+        raise ValueError(f"facade {name} needs at least one column and one row")
+    for key in ["width", "height", "mullion_thickness", "mullion_depth"]:
+        if spec[key] <= 0:
+            raise ValueError(f"facade {name} needs a positive {key}")
+    if spec["spandrel_interval"] < 0:
+        raise ValueError(f"facade {name} has a negative spandrel_interval")
+    if spec["panel_output"] not in ("MESH", "INSTANCED"):
+        raise ValueError(f"facade {name} has an unknown panel_output {spec['panel_output']!r}")
+    panel_width, panel_height = panel_size(spec["width"], spec["height"], spec["columns"], spec["rows"], spec["mullion_thickness"])
+    if panel_width <= 0 or panel_height <= 0:
+        raise ValueError(f"facade {name} has no room for panels between its mullions")
+    return spec
+
+def load_facade_specs(path):
+    """Reads every facade spec from a JSON or CSV file"""
+    with open(path, newline="") as file:
+        if path.lower().endswith(".csv"):
+            entries = list(csv.DictReader(file))
+        else:
+            entries = json.load(file)
+            if isinstance(entries, dict):
+                entries = entries.get("facades", [])
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        raise ValueError("expected a list of facade objects")
+    return [parse_facade_spec(entry, index) for index, entry in enumerate(entries)]
+
+def facade_arrays(spec):
+    return curtain_wall_arrays(
+        spec["width"], spec["height"], spec["columns"], spec["rows"],
+        spec["mullion_thickness"], spec["mullion_depth"], spec["spandrel_interval"]
+    )
+
+def generate_facades(context, specs, workers=None):
+    """Builds every facade into its own collection under CurtainWall_Facades.
+
+    The arrays of independent facades are computed on a thread pool (the
+    NumPy kernels release the GIL); each facade is linked into the scene on
+    the main thread as soon as its arrays are ready. Returns (facades
+    built, [(name, reason), ...] for the facades skipped).
+    """
+    parent = bpy.data.collections.get("CurtainWall_Facades")
+    if parent is None:
+        parent = bpy.data.collections.new("CurtainWall_Facades")
+    if parent.name not in context.scene.collection.children:
+        context.scene.collection.children.link(parent)
+
+    built, skipped = 0, []
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = {pool.submit(facade_arrays, spec): spec for spec in specs}
+        for future in as_completed(futures):
+            spec = futures[future]
+            try:
+                arrays = future.result()
+            except (ValueError, ArithmeticError, MemoryError) as error:
+                skipped.append((spec["name"], str(error)))
+                continue
+            if arrays is None:
+                skipped.append((spec["name"], "no room for panels between the mullions"))
+                continue
+
+            collection = bpy.data.collections.get(spec["name"])
+            if collection is None:
+                collection = bpy.data.collections.new(spec["name"])
+                parent.children.link(collection)
+
+            for obj in write_curtain_wall(context, spec["name"], arrays, spec["panel_output"], collection):
+                obj.location = spec["origin"]
+                obj.rotation_euler = (0.0, 0.0, math.radians(spec["direction"]))
+            built += 1
+
+    return built, skipped
+
+class GenerateFacadesFromSpec(bpy.types.Operator):
+    bl_idname = "object.generate_curtain_wall_facades"
+    bl_label = "Generate Facades From Spec"
+    bl_description = "Build every facade listed in a JSON or CSV spec file"
+
+    def execute(self, context):
+        props = context.scene.curtain_wall_props
+        path = bpy.path.abspath(props.facade_spec)
+        if np is None:
+            self.report({'ERROR'}, "Batch facade generation needs NumPy")
+            return {'CANCELLED'}
+        if not os.path.isfile(path):
+            self.report({'ERROR'}, f"Facade spec not found: {path}")
+            return {'CANCELLED'}
+
+        try:
+            specs = load_facade_specs(path)
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            self.report({'ERROR'}, f"Could not read facade spec {os.path.basename(path)}: {error}")
+            return {'CANCELLED'}
+        built, skipped = generate_facades(context, specs, props.batch_workers or None)
+        for name, reason in skipped:
+            self.report({'WARNING'}, f"Skipped facade {name}: {reason}")
+        self.report({'INFO'}, f"Built {built} of {len(specs)} facades")
+        return {'FINISHED'}
+
+class GenerateCurtainWall(bpy.types.Operator):
+    bl_idname = "object.generate_curtain_wall"
+    bl_label = "Generate Curtain Wall"
+    
+    def execute(self, context):
+        props = context.scene.curtain_wall_props
+        create_curtain_wall(
+            props.width, props.height, props.columns, props.rows, props.mullion_thickness, props.mullion_depth,
+            props.spandrel_interval, props.panel_output
+        )
+        return {'FINISHED'}
+
+class CurtainWallPanel(bpy.types.Panel):
+    bl_label = "Curtain Wall Generator"
+    bl_idname = "OBJECT_PT_curtain_wall"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Curtain Wall"
+    
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.curtain_wall_props
+
+        layout.prop(props, "width")
+        layout.prop(props, "height")
+        layout.prop(props, "columns")
+        layout.prop(props, "rows")
+        layout.prop(props, "mullion_thickness")
+        layout.prop(props, "mullion_depth")
+        layout.prop(props, "spandrel_interval")
+        layout.prop(props, "panel_output")
+        
+        layout.operator("object.generate_curtain_wall")
+
+        box = layout.box()
+        box.label(text="Batch Facades")
+        box.prop(props, "facade_spec")
+        box.prop(props, "batch_workers")
+        box.operator("object.generate_curtain_wall_facades")
+
+        # Panel schedule of the last generated wall
+        panel_obj = bpy.data.objects.get("CurtainWall_Panels")
+        if panel_obj and "panel_schedule" in panel_obj:
+            box = layout.box()
+            box.label(text="Panel Schedule")
+            for panel_type, count in panel_obj["panel_schedule"].items():
+                row = box.row()
+                row.label(text=panel_type)
+                row.label(text=str(count))
+
+def register():
+    bpy.utils.register_class(CurtainWallProperties)
+    bpy.utils.register_class(GenerateCurtainWall)
+    bpy.utils.register_class(GenerateFacadesFromSpec)
+    bpy.utils.register_class(CurtainWallPanel)
+    bpy.types.Scene.curtain_wall_props = bpy.props.PointerProperty(type=CurtainWallProperties)
+
+def unregister():
+    bpy.utils.unregister_class(CurtainWallProperties)
+    bpy.utils.unregister_class(GenerateCurtainWall)
+    bpy.utils.unregister_class(GenerateFacadesFromSpec)
+    bpy.utils.unregister_class(CurtainWallPanel)
+    del bpy.types.Scene.curtain_wall_props
+
+def main(argv):
+    """Headless batch entry point, see "Curtain Wall Generator/BuildFacades.py":
+
+    blender -b --python "Curtain Wall Generator/BuildFacades.py" -- --facades spec.json [--workers N] [--output out.blend]
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build curtain wall facades from a spec file")
+    parser.add_argument("--facades", required=True, help="JSON or CSV facade spec")
+    parser.add_argument("--workers", type=int, default=None, help="Worker threads (default: one per core)")
+    parser.add_argument("--output", help="Save the result to this .blend file")
+    args = parser.parse_args(argv)
+
+    specs = load_facade_specs(args.facades)
+    built, skipped = generate_facades(bpy.context, specs, args.workers)
+    for name, reason in skipped:
+        print(f"Skipped facade {name}: {reason}")
+    print(f"Built {built} of {len(specs)} facades.")
+    if args.output:
+        bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.output))
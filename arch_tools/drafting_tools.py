@@ -0,0 +1,336 @@
+# Drafting Tools: a set of basic drafting tools like AutoCAD.
+
+import bpy
+from bpy_extras import view3d_utils
+from mathutils import Vector, geometry
+
+from . import kernel, lazy_import
+
+np = lazy_import("numpy")  # Snapping and drafting layers are off without NumPy
+
+PREVIEW_COLOR = (1.0, 0.6, 0.1, 1.0)
+SNAP_COLORS = {
+    "ENDPOINT": (0.2, 1.0, 0.3, 1.0),
+    "INTERSECTION": (1.0, 0.3, 0.3, 1.0),
+    "MIDPOINT": (0.3, 0.7, 1.0, 1.0),
+}
+LAYER_COLLECTION = "Drafting Layers"
+LAYER_WELD_DISTANCE = 1e-4
+SMALL_APPEND = 16  # Appends up to this many elements are written one by one
+
+# Utility function to create a line between two points
+def create_line(start, end):
+    mesh = bpy.data.meshes.new("Line")
+    obj = bpy.data.objects.new("Line Object", mesh)
+    bpy.context.collection.objects.link(obj)
+    mesh.from_pydata([start, end], [(0, 1)], [])
+    mesh.update()
+    return obj
+
+# Drafting layers: one edge mesh per layer instead of one object per line.
+# Segments go into a kernel.WeldedEdges buffer, and only the vertices and
+# edges it gained are added to the mesh.
+class DraftingLayer:
+    def __init__(self, obj, weld_distance=LAYER_WELD_DISTANCE):
+        self.obj = obj
+        mesh = obj.data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        ed = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", ed)
+        self.network = kernel.WeldedEdges(co, ed, weld_distance)
+
+    @classmethod
+    def get(cls, context, name, weld_distance=LAYER_WELD_DISTANCE):
+        """The layer's object, created in the Drafting Layers collection if missing"""
+        obj = next((o for o in bpy.data.objects if o.get("drafting_layer") == name and o.type == 'MESH'), None)
+        if obj is None:
+            obj = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+            obj["drafting_layer"] = name
+            collection = bpy.data.collections.get(LAYER_COLLECTION)
+            if collection is None:
+                collection = bpy.data.collections.new(LAYER_COLLECTION)
+                context.scene.collection.children.link(collection)
+            collection.objects.link(obj)
+        return cls(obj, weld_distance)
+
+    def append(self, starts, ends, sync=True):
+        """Adds world-space segments to the layer. Returns how many edges were new.
+
+        Bulk loaders can pass sync=False and call sync() once at the end.
+        """
+        matrix = np.array(self.obj.matrix_world.inverted())
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        added = self.network.append(starts, ends)
+        if sync:
+            self.sync()
+        return added
+
+    def sync(self):
+        """Adds the buffer's new vertices and edges to the mesh"""
+        mesh = self.obj.data
+        coords, edges = self.network.coords, self.network.edges
+        if len(mesh.vertices) > len(coords) or len(mesh.edges) > len(edges):
+            mesh.clear_geometry()  # Edited elsewhere since the layer was read
+        old_verts, old_edges = len(mesh.vertices), len(mesh.edges)
+        mesh.vertices.add(len(coords) - old_verts)
+        mesh.edges.add(len(edges) - old_edges)
+
+        if len(coords) - old_verts + len(edges) - old_edges <= SMALL_APPEND:
+            for i in range(old_verts, len(coords)):
+                mesh.vertices[i].co = coords[i]
+            for i in range(old_edges, len(edges)):
+                mesh.edges[i].vertices = edges[i].tolist()
+        else:
+            mesh.vertices.foreach_set("co", coords.astype(np.float32).ravel())
+            mesh.edges.foreach_set("vertices", edges.astype(np.int32).ravel())
+        mesh.update()
+
+# Projects a mouse position onto the ground (Z = 0) plane of a 3D viewport
+def mouse_to_ground(region, rv3d, mouse):
+    origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, mouse)
+    direction = view3d_utils.region_2d_to_vector_3d(region, rv3d, mouse)
+    return geometry.intersect_line_plane(origin, origin + direction, Vector((0, 0, 0)), Vector((0, 0, 1)))
+
+# Builds the snapping index over the edges of every visible mesh, in world space
+def scene_snap_index(context):
+    from .snapping import SnapIndex
+
+    depsgraph = context.evaluated_depsgraph_get()
+    coords, edges, offset = [], [], 0
+    for obj in context.visible_objects:
+        if obj.type != 'MESH':
+            continue
+        mesh = obj.evaluated_get(depsgraph).data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        ed = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", ed)
+
+        matrix = np.array(obj.matrix_world)
+        coords.append(co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3])
+        edges.append(ed.reshape(-1, 2) + offset)
+        offset += len(mesh.vertices)
+
+    if not coords:
+        return SnapIndex(np.empty((0, 3)), np.empty((0, 2, 3)))
+    return SnapIndex.from_mesh_arrays(np.vstack(coords), np.vstack(edges))
+
+# Draws the line being dragged and the current snap as a viewport overlay,
+# so no datablock changes until release
+def draw_line_preview(op, context):
+    import gpu
+    from gpu_extras.batch import batch_for_shader
+
+    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    if op.dragging and op.current_point is not None:
+        batch = batch_for_shader(shader, 'LINES', {"pos": [op.start_point, op.current_point]})
+        gpu.state.line_width_set(2.0)
+        shader.uniform_float("color", PREVIEW_COLOR)
+        batch.draw(shader)
+        gpu.state.line_width_set(1.0)
+
+    if op.snap_kind is not None:
+        batch = batch_for_shader(shader, 'POINTS', {"pos": [op.snap_point]})
+        gpu.state.point_size_set(10.0)
+        shader.uniform_float("color", SNAP_COLORS[op.snap_kind])
+        batch.draw(shader)
+        gpu.state.point_size_set(1.0)
+
+# Draw mode and snap settings for the line tool
+class DraftingToolsProperties(bpy.types.PropertyGroup):
+    draw_mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('OBJECTS', "Objects", "Each line becomes its own object"),
+            ('LAYER', "Layer", "Each line is added to the drafting layer's mesh"),
+            ('POLYLINE', "Polyline", "Click from point to point, adding each segment to the drafting layer"),
+        ],
+        default='OBJECTS',
+    )
+    layer_name: bpy.props.StringProperty(name="Layer", default="Layer 0", description="Drafting layer the lines are added to")
+    snap_endpoint: bpy.props.BoolProperty(name="Endpoint", default=True, description="Snap to vertices")
+    snap_midpoint: bpy.props.BoolProperty(name="Midpoint", default=True, description="Snap to edge midpoints")
+    snap_intersection: bpy.props.BoolProperty(name="Intersection", default=True, description="Snap to where edges cross in plan")
+    snap_pixels: bpy.props.IntProperty(name="Snap Distance", default=10, min=1, max=100, subtype='PIXEL', description="How close the cursor must be to snap")
+
+    def snap_kinds(self):
+        return [kind for kind, enabled in (
+            ("ENDPOINT", self.snap_endpoint),
+            ("INTERSECTION", self.snap_intersection),
+            ("MIDPOINT", self.snap_midpoint),
+        ) if enabled]
+
+# Operator to create a line using mouse and X-Y axis control
+class DraftingToolsLineOperator(bpy.types.Operator):
+    bl_idname = "drafting_tools.create_line"
+    bl_label = "Create Line with Mouse"
+    bl_options = {'REGISTER', 'UNDO', 'BLOCKING'}
+    
+    start_point = None
+    current_point = None
+    dragging = False  # Track if the mouse is being dragged
+    snaps = None
+    snap_point = None
+    snap_kind = None
+    
+    def mouse_point(self, event):
+        """The snapped ground point under the mouse, or None outside the viewport"""
+        mouse = (event.mouse_x - self.region.x, event.mouse_y - self.region.y)
+        if not (0 <= mouse[0] < self.region.width and 0 <= mouse[1] < self.region.height):
+            return None
+        point = mouse_to_ground(self.region, self.rv3d, mouse)
+
+        self.snap_kind = None
+        if point is not None and self.snaps is not None:
+            # The snap distance in pixels, measured on the ground plane under the mouse
+            edge = mouse_to_ground(self.region, self.rv3d, (mouse[0] + self.snap_pixels, mouse[1]))
+            if edge is not None:
+                hit = self.snaps.snap(point.xy, (edge - point).length, self.snap_kinds)
+                if hit is not None:
+                    self.snap_point, self.snap_kind = Vector(hit[0]), hit[1]
+                    return self.snap_point.copy()
+        return point
+
+    def modal(self, context, event):
+        if event.type == 'MOUSEMOVE':
+            # Only the preview end point and snap marker move; the overlay redraws them
+            point = self.mouse_point(event)
+            if point is not None and self.dragging:
+                self.current_point = point
+            self.area.tag_redraw()
+            return {'RUNNING_MODAL'} if self.dragging else {'PASS_THROUGH'}
+        
+        elif event.type == 'LEFTMOUSE' and event.value == 'PRESS':
+            if self.mode == 'POLYLINE' and self.dragging:
+                return {'RUNNING_MODAL'}  # The segment is added on release
+
+            # Start the line at the clicked ground point
+            point = self.mouse_point(event)
+            if point is None:
+                return {'PASS_THROUGH'}
+            self.dragging = True
+            self.start_point = self.current_point = point
+            return {'RUNNING_MODAL'}
+        
+        elif event.type == 'LEFTMOUSE' and event.value == 'RELEASE' and self.dragging:
+            # Commit the line when left-click is released, then wait for the next one.
+            # A polyline carries on from the end of the segment.
+            self.dragging = self.mode == 'POLYLINE'
+            if (self.current_point - self.start_point).length > 1e-6:
+                self.commit(self.start_point, self.current_point)
+                self.start_point = self.current_point.copy()
+            self.area.tag_redraw()
+            return {'RUNNING_MODAL'}
+
+        elif event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS' and self.mode == 'POLYLINE' and self.dragging:
+            # End the polyline; the tool stays active for the next one
+            self.dragging = False
+            self.area.tag_redraw()
+            return {'RUNNING_MODAL'}
+
+        elif event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+            # Finish on right-click or escape; nothing drawn counts as cancelled
+            self.finish(context)
+            return {'FINISHED'} if self.lines_drawn else {'CANCELLED'}
+
+        return {'PASS_THROUGH'}
+
+    def invoke(self, context, event):
+        # Draw in the 3D viewport's main region, also when started from the sidebar
+        self.area = context.area
+        self.region = next((r for r in self.area.regions if r.type == 'WINDOW'), None) if self.area else None
+        if self.region is None or context.space_data.type != 'VIEW_3D':
+            self.report({'WARNING'}, "Draw Line needs a 3D viewport")
+            return {'CANCELLED'}
+        self.rv3d = context.space_data.region_3d
+
+        self.dragging = False
+        self.start_point = self.current_point = None
+        self.lines_drawn = 0
+
+        tool = context.scene.drafting_tools
+        self.mode = tool.draw_mode
+        self.layer = None
+        if self.mode != 'OBJECTS':
+            if np is None:
+                self.report({'WARNING'}, "Drafting layers need NumPy, drawing separate objects")
+                self.mode = 'OBJECTS'
+            else:
+                self.layer = DraftingLayer.get(context, tool.layer_name)
+
+        # One snapping index for the whole session, extended as lines are drawn
+        self.snap_kinds = tool.snap_kinds()
+        self.snap_pixels = tool.snap_pixels
+        self.snaps = None
+        if np is not None and self.snap_kinds:
+            self.snaps = scene_snap_index(context)
+
+        self.draw_handle = bpy.types.SpaceView3D.draw_handler_add(draw_line_preview, (self, context), 'WINDOW', 'POST_VIEW')
+        if self.mode == 'POLYLINE':
+            context.workspace.status_text_set("Click to add points, Right-click/Esc to end the polyline, again to finish")
+        else:
+            context.workspace.status_text_set("Drag to draw lines, Right-click/Esc to finish")
+
+        # Add the operator as a modal to track mouse movements
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def commit(self, start, end):
+        if self.layer is not None:
+            self.layer.append([start], [end])
+        else:
+            create_line(start, end)
+        self.lines_drawn += 1
+        if self.snaps is not None:
+            self.snaps.add_segment(start, end)
+
+    def finish(self, context):
+        self.dragging = False
+        self.snaps = None
+        self.layer = None
+        bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle, 'WINDOW')
+        context.workspace.status_text_set(None)
+        self.area.tag_redraw()
+
+# Addon Panel to hold the buttons and properties
+class DraftingToolsPanel(bpy.types.Panel):
+    bl_label = "Drafting Tools"
+    bl_idname = "VIEW3D_PT_drafting_tools"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Drafting Tools'
+
+    def draw(self, context):
+        layout = self.layout
+        tool = context.scene.drafting_tools
+
+        # Line Tool button, where its lines go, and its snaps
+        layout.operator("drafting_tools.create_line", text="Draw Line")
+        layout.prop(tool, "draw_mode", expand=True)
+        if tool.draw_mode != 'OBJECTS':
+            layout.prop(tool, "layer_name")
+        layout.operator("import_scene.arch_linework", icon='IMPORT')
+        col = layout.column(heading="Snap")
+        col.prop(tool, "snap_endpoint")
+        col.prop(tool, "snap_midpoint")
+        col.prop(tool, "snap_intersection")
+        layout.prop(tool, "snap_pixels")
+
+# Register and Unregister functions
+def register():
+    bpy.utils.register_class(DraftingToolsProperties)  # Register the properties class
+    bpy.utils.register_class(DraftingToolsLineOperator)
+    bpy.utils.register_class(DraftingToolsPanel)
+    
+    # Add property to store the snap settings
+    bpy.types.Scene.drafting_tools = bpy.props.PointerProperty(type=DraftingToolsProperties)
+
+def unregister():
+    bpy.utils.unregister_class(DraftingToolsProperties)  # Unregister the properties class
+    bpy.utils.unregister_class(DraftingToolsLineOperator)
+    bpy.utils.unregister_class(DraftingToolsPanel)
+    
+    # Remove property from scene
+    del bpy.types.Scene.drafting_tools
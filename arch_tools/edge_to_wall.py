@@ -0,0 +1,111 @@
+# Edge To Wall: builds walls with thickness and height along a pre-drawn edge network.
+
+#___________________________________________________________________
+
+import bpy
+
+from . import kernel, lazy_import
+from .mesh_utils import replace_output, write_mesh_loops
+
+np = lazy_import("numpy")
+
+GENERATOR = "Edge To Wall"
+#___________________________________________________________________
+
+class EdgeToWallProperties(bpy.types.PropertyGroup):
+    wall_thickness: bpy.props.FloatProperty(name="Thickness", default=0.2, min=0.01, unit='LENGTH', description="Wall thickness, centred on the edges")
+    wall_height: bpy.props.FloatProperty(name="Height", default=3.0, min=0.01, unit='LENGTH', description="Wall height above the edges")
+    mitre_limit: bpy.props.FloatProperty(name="Mitre Limit", default=4.0, min=1.0, description="Longest mitre corner, in half wall thicknesses, before it is cut back")
+
+
+def read_edge_network(obj, selected_only):
+    """Returns the (N, 3) vertex and (E, 2) edge arrays of a mesh object"""
+    mesh = obj.data
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    edges = edges.reshape(-1, 2)
+
+    if selected_only:
+        select = np.empty(len(mesh.edges), dtype=bool)
+        mesh.edges.foreach_get("select", select)
+        edges = edges[select]
+    return coords.reshape(-1, 3), edges
+
+
+def build_walls(context, source, props, selected_only=False):
+    """Writes the walls of every edge of source into one mesh. Returns the wall object."""
+    coords, edges = read_edge_network(source, selected_only)
+    corners, loop_verts, loop_starts = kernel.wall_footprint(coords, edges, props.wall_thickness, props.mitre_limit)
+    verts, loop_verts, loop_starts = kernel.extrude_footprint(corners, loop_verts, loop_starts, props.wall_height)
+
+    obj, mesh = replace_output(context, f"{source.name}_Walls", f"{source.name}_WallsMesh", GENERATOR)
+    write_mesh_loops(mesh, verts, loop_verts, loop_starts)
+    obj.matrix_world = source.matrix_world.copy()
+    return obj
+
+
+class EdgeToWallOperator(bpy.types.Operator):
+    bl_idname = "object.edge_to_wall"
+    bl_label = "Generate Walls"
+    bl_description = "Build walls along the edges of the active mesh (the selected edges in Edit Mode)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.active_object.type == 'MESH'
+
+    def execute(self, context):
+        if np is None:
+            self.report({'ERROR'}, "Edge to Wall needs NumPy")
+            return {'CANCELLED'}
+
+        source = context.active_object
+        selected_only = source.mode == 'EDIT'
+        if selected_only:
+            source.update_from_editmode()
+        if not len(source.data.edges):
+            self.report({'ERROR'}, f"{source.name} has no edges to build walls on")
+            return {'CANCELLED'}
+
+        walls = build_walls(context, source, context.scene.edge_to_wall_props, selected_only)
+        self.report({'INFO'}, f"Built {walls.name}: {len(walls.data.vertices)} vertices, {len(walls.data.polygons)} faces")
+        return {'FINISHED'}
+
+
+class EdgeToWallPanel(bpy.types.Panel):
+    bl_label = "Edge to Wall Panel"
+    bl_idname = "PT_EdgeToWallPanel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Edge To Wall Tab'
+    
+    def draw(self,context):
+        layout = self.layout
+        props = context.scene.edge_to_wall_props
+        
+        layout.prop(props, "wall_thickness")
+        layout.prop(props, "wall_height")
+        layout.prop(props, "mitre_limit")
+        layout.operator("object.edge_to_wall")
+
+
+#___________________________________________________________________
+
+classes = [
+    EdgeToWallProperties,
+    EdgeToWallOperator,
+    EdgeToWallPanel,
+]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.edge_to_wall_props = bpy.props.PointerProperty(type=EdgeToWallProperties)
+
+
+def unregister():
+    del bpy.types.Scene.edge_to_wall_props
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,741 @@
+# Geometry kernel shared by the generators.
+#
+# Everything here works on plain NumPy arrays and never touches bpy, so the
+# kernel can be imported, profiled and tested outside Blender. The tool
+# modules compute their geometry with these functions and hand the arrays
+# to mesh_utils to be written into Blender meshes.
+
+import hashlib
+import importlib
+
+from . import lazy_import
+
+np = lazy_import("numpy")
+scipy = lazy_import("scipy")  # None solves with the matrix-free conjugate gradient in form_find
+
+
+# Corner layout of a box as fractions of (width, depth, height)
+BOX_CORNERS = (
+    (0, 0, 0),  # Bottom left front
+    (1, 0, 0),  # Bottom right front
+    (1, 1, 0),  # Bottom right back
+    (0, 1, 0),  # Bottom left back
+    (0, 0, 1),  # Top left front
+    (1, 0, 1),  # Top right front
+    (1, 1, 1),  # Top right back
+    (0, 1, 1),  # Top left back
+)
+
+BOX_FACES = (
+    (0, 3, 2, 1),  # Bottom
+    (4, 5, 6, 7),  # Top
+    (0, 1, 5, 4),  # Front
+    (1, 2, 6, 5),  # Right
+    (2, 3, 7, 6),  # Back
+    (3, 0, 4, 7),  # Left
+)
+
+
+def rotate_z(points, angles):
+    """Rotates (N, V, 3) points about Z by the (N,) angles, one per row"""
+    cos = np.cos(angles)[:, None]
+    sin = np.sin(angles)[:, None]
+    x, y = points[:, :, 0], points[:, :, 1]
+
+    rotated = np.empty(points.shape)
+    rotated[:, :, 0] = x * cos - y * sin
+    rotated[:, :, 1] = x * sin + y * cos
+    rotated[:, :, 2] = points[:, :, 2]
+    return rotated
+
+
+def place_instances(local_verts, offsets, rotations):
+    """Places a copy of local_verts (V, 3) at every offset, rotated about Z.
+
+    Returns an (N, V, 3) array for N offsets.
+    """
+    local = np.broadcast_to(local_verts, (len(offsets),) + local_verts.shape)
+    return rotate_z(local, rotations) + offsets[:, None, :]
+
+
+def box_corners(origins, sizes, rotations=None):
+    """Returns the (N, 8, 3) corners of N boxes.
+
+    origins is (N, 3), sizes a (3,) size shared by every box or an (N, 3)
+    array and rotations optional (N,) angles about Z through each origin.
+    """
+    origins = np.asarray(origins, dtype=np.float64)
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float64), origins.shape)
+    local = np.array(BOX_CORNERS, dtype=np.float64)[None, :, :] * sizes[:, None, :]
+    if rotations is not None:
+        local = rotate_z(local, rotations)
+    return local + origins[:, None, :]
+
+
+def box_faces(count):
+    """Returns the (count * 6, 4) face indices of count consecutive boxes"""
+    base = np.arange(count)[:, None, None] * len(BOX_CORNERS)
+    faces = np.array(BOX_FACES)[None, :, :] + base  # (N, 6, 4)
+    return faces.reshape(-1, len(BOX_FACES[0]))
+
+
+def box_arrays(origins, sizes, rotations=None):
+    """Returns (verts, faces) arrays for N boxes, see box_corners.
+
+    verts is (N * 8, 3) and faces is (N * 6, 4). Box i owns vertices
+    [i * 8, i * 8 + 8) and faces [i * 6, i * 6 + 6).
+    """
+    corners = box_corners(origins, sizes, rotations)
+    return corners.reshape(-1, 3), box_faces(len(corners))
+
+
+def cylinders(bases, heights, radius, segments=16):
+    """Returns (verts, loop_verts, loop_starts) of N upright capped cylinders.
+
+    bases is (N, 3), heights a scalar or (N,) array. Each cylinder has a
+    bottom and a top ring of segments vertices, segments side quads and
+    two n-gon caps.
+    """
+    bases = np.asarray(bases, dtype=np.float64).reshape(-1, 3)
+    heights = np.broadcast_to(np.asarray(heights, dtype=np.float64), len(bases))
+    angle = np.linspace(0.0, 2 * np.pi, segments, endpoint=False)
+    ring = np.column_stack((np.cos(angle) * radius, np.sin(angle) * radius, np.zeros(segments)))
+
+    bottom = bases[:, None, :] + ring
+    top = bottom + np.column_stack((np.zeros((len(bases), 2)), heights))[:, None, :]
+    verts = np.concatenate((bottom, top), axis=1).reshape(-1, 3)
+
+    j = np.arange(segments)
+    k = (j + 1) % segments
+    local = np.concatenate((
+        np.column_stack((j, k, k + segments, j + segments)).ravel(),  # Sides
+        j[::-1],  # Bottom cap, facing down
+        j + segments,  # Top cap
+    ))
+    loop_verts = (local + 2 * segments * np.arange(len(bases))[:, None]).ravel()
+    local_starts = np.append(np.arange(0, 4 * segments, 4), [4 * segments, 5 * segments])
+    loop_starts = (local_starts + len(local) * np.arange(len(bases))[:, None]).ravel()
+    return verts, loop_verts, loop_starts
+
+
+def bilinear_grid(corners, cuts):
+    """Bilinearly interpolates a (cuts + 2)^2 grid of points between four corners.
+
+    Row-major from corner 1: u runs towards corner 2, v towards corner 4.
+    Returns a (side * side, 3) array.
+    """
+    a1, a2, a3, a4 = np.array(corners, dtype=np.float64)
+    t = np.linspace(0.0, 1.0, cuts + 2)
+    u = t[None, :, None]
+    v = t[:, None, None]
+    grid = (1 - u) * (1 - v) * a1 + u * (1 - v) * a2 + u * v * a3 + (1 - u) * v * a4
+    return grid.reshape(-1, 3)
+
+
+def grid_faces(cuts):
+    """Returns the (cells, 4) quad indices of a bilinear_grid"""
+    side = cuts + 2
+    node = np.arange(side * side).reshape(side, side)
+    return np.stack((node[:-1, :-1], node[:-1, 1:], node[1:, 1:], node[1:, :-1]), axis=-1).reshape(-1, 4)
+
+
+def grid_corner_indices(cuts):
+    """Indices of the four corner points of a bilinear_grid, in corner order"""
+    side = cuts + 2
+    return [0, side - 1, side * side - 1, side * (side - 1)]
+
+
+def face_loops(faces):
+    """Returns (loop_verts, loop_starts) for an (F, S) array of S-sided faces"""
+    n_faces, n_sides = faces.shape
+    return faces.ravel(), np.arange(0, n_faces * n_sides, n_sides)
+
+
+# Curtain walls: a lattice of mullions and transoms around columns x rows
+# panel openings. The panels are grouped into types by size and kind so
+# they can be instanced.
+
+def panel_size(width, height, columns, rows, mullion_thickness):
+    """Returns the (width, height) of every panel opening between the mullions"""
+    panel_width = (width - (columns + 1) * mullion_thickness) / columns
+    panel_height = (height - (rows + 1) * mullion_thickness) / rows
+    return panel_width, panel_height
+
+
+def lattice_lines(count, pane, mullion_thickness):
+    """Returns the 2 * (count + 1) edge coordinates of count panes separated by mullions"""
+    start = np.arange(count + 1) * (pane + mullion_thickness)
+    return np.column_stack((start, start + mullion_thickness)).ravel()
+
+
+def curtain_wall_lattice(width, height, columns, rows, mullion_thickness, mullion_depth):
+    """Returns the welded mullion/transom frame and the panels as arrays.
+
+    The frame is one watertight mesh on a grid of nodes at every mullion and
+    transom edge, so neighbouring members share their vertices. Returns
+    (frame_verts, frame_faces, panel_verts, panel_faces).
+    """
+    panel_width, panel_height = panel_size(width, height, columns, rows, mullion_thickness)
+    xs = lattice_lines(columns, panel_width, mullion_thickness)
+    zs = lattice_lines(rows, panel_height, mullion_thickness)
+    nx, nz = len(xs), len(zs)
+
+    # Front nodes at y = 0 followed by back nodes at y = -mullion_depth
+    gx, gz = np.meshgrid(xs, zs, indexing="ij")
+    front = np.column_stack((gx.ravel(), np.zeros(nx * nz), gz.ravel()))
+    back = front.copy()
+    back[:, 1] = -mullion_depth
+    frame_verts = np.vstack((front, back))
+    back_offset = nx * nz
+
+    # Grid cells, counter-clockwise in the XZ plane; odd/odd cells are panel openings
+    node = np.arange(nx * nz).reshape(nx, nz)
+    cells = np.stack((node[:-1, :-1], node[1:, :-1], node[1:, 1:], node[:-1, 1:]), axis=-1)
+    a, b = np.meshgrid(np.arange(nx - 1), np.arange(nz - 1), indexing="ij")
+    opening = (a % 2 == 1) & (b % 2 == 1)
+    frame_cells = cells[~opening]
+    openings = cells[opening]
+
+    # Outer perimeter edges counter-clockwise, and every edge around an opening
+    perimeter = np.concatenate((
+        np.column_stack((node[:-1, 0], node[1:, 0])),
+        np.column_stack((node[-1, :-1], node[-1, 1:])),
+        np.column_stack((node[1:, -1], node[:-1, -1])),
+        np.column_stack((node[0, 1:], node[0, :-1])),
+    ))
+    reveals = np.stack((openings, np.roll(openings, -1, axis=1)), axis=-1).reshape(-1, 2)
+
+    p, q = perimeter[:, 0], perimeter[:, 1]
+    perimeter_faces = np.column_stack((p, q, q + back_offset, p + back_offset))
+    p, q = reveals[:, 0], reveals[:, 1]
+    reveal_faces = np.column_stack((q, p, p + back_offset, q + back_offset))
+
+    frame_faces = np.concatenate((
+        frame_cells[:, ::-1],  # Front, facing +Y
+        frame_cells + back_offset,  # Back, facing -Y
+        perimeter_faces,
+        reveal_faces,
+    ))
+
+    panel_verts = front[openings].reshape(-1, 3)
+    panel_faces = np.arange(len(panel_verts)).reshape(-1, 4)
+    return frame_verts, frame_faces, panel_verts, panel_faces
+
+
+PANEL_KINDS = ["Vision", "Spandrel"]
+
+
+def panel_kinds(columns, rows, spandrel_interval):
+    """Returns the PANEL_KINDS index of every panel, in lattice (column-major) order"""
+    row = np.tile(np.arange(rows), columns)
+    if spandrel_interval > 0:
+        return ((row + 1) % spandrel_interval == 0).astype(int)
+    return np.zeros(len(row), dtype=int)
+
+
+def group_panels(panel_verts, kinds):
+    """Groups panels into prototypes by (width, height, kind).
+
+    Returns (prototypes, instance_type, origins): a list of (width, height,
+    kind name) tuples, the prototype index of every panel and the lower
+    left corner every panel instance is placed at.
+    """
+    corners = panel_verts.reshape(-1, 4, 3)
+    origins = corners[:, 0]
+    size = np.round(corners[:, 2] - corners[:, 0], 4)[:, [0, 2]]
+
+    keys, instance_type = np.unique(np.column_stack((size, kinds)), axis=0, return_inverse=True)
+    prototypes = [(float(width), float(height), PANEL_KINDS[int(kind)]) for width, height, kind in keys]
+    return prototypes, instance_type.ravel(), origins
+
+
+def panel_schedule(prototypes, instance_type):
+    """Returns {"<kind> <width> x <height>": count} for every panel type"""
+    counts = np.bincount(instance_type, minlength=len(prototypes))
+    return {
+        f"{kind} {width:.3f} x {height:.3f}": int(count)
+        for (width, height, kind), count in zip(prototypes, counts)
+    }
+
+
+# Wall networks: every edge of a plan graph becomes a wall of the same
+# thickness. Around each node the half-edges are sorted by angle, and the
+# corner between two neighbours is where the left face of one meets the
+# right face of the next. Each corner is shared by both walls, so the
+# footprint is welded by construction. Two walls meet on a mitre; at three
+# or more a hub polygon fills the gap between them, and a free end is cut
+# square.
+
+def cross_2d(a, b):
+    """Z component of the cross product of (N, 2) vectors"""
+    return a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+
+
+def wall_footprint(coords, edges, thickness, mitre_limit=4.0):
+    """Returns (corners, loop_verts, loop_starts) of the plan footprint of a wall network.
+
+    coords is (N, 3) and only its xy is offset; corners keep their node's z.
+    Mitre corners further than mitre_limit half-thicknesses from their node
+    are pulled in along the bisector.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    edges = np.unique(np.sort(np.asarray(edges, dtype=np.int64).reshape(-1, 2), axis=1), axis=0)
+    edges = edges[np.linalg.norm(coords[edges[:, 1], :2] - coords[edges[:, 0], :2], axis=1) > 1e-9]
+    half = thickness / 2
+
+    # Half-edge 2e runs u -> v and 2e + 1 runs v -> u
+    origin = edges.ravel()
+    target = edges[:, ::-1].ravel()
+    direction = coords[target, :2] - coords[origin, :2]
+    direction /= np.linalg.norm(direction, axis=1)[:, None]
+    normal = np.column_stack((-direction[:, 1], direction[:, 0]))  # Left of the half-edge
+
+    # Counterclockwise order around each node, and each half-edge's next neighbour
+    order = np.lexsort((np.arctan2(direction[:, 1], direction[:, 0]), origin))
+    degree = np.bincount(origin, minlength=len(coords))
+    first = np.concatenate(([0], np.cumsum(degree)[:-1]))
+    position = np.arange(len(order))
+    start = first[origin[order]]
+    successor = order[start + (position - start + 1) % degree[origin[order]]]
+    next_edge = np.empty_like(order)
+    next_edge[order] = successor
+    prev_edge = np.empty_like(order)
+    prev_edge[successor] = order
+
+    # Corner h sits left of half-edge h: its left face against the next one's right face
+    base = coords[origin, :2]
+    left_point = base + normal * half
+    right_dir = direction[next_edge]
+    right_point = base - normal[next_edge] * half
+    denom = cross_2d(direction, right_dir)
+    parallel = np.abs(denom) < 1e-9
+    s = cross_2d(right_point - left_point, right_dir) / np.where(parallel, 1.0, denom)
+    corner = np.where(parallel[:, None], left_point, left_point + s[:, None] * direction)
+
+    offset = corner - base
+    reach = np.linalg.norm(offset, axis=1)
+    limit = mitre_limit * half
+    corner = np.where((reach > limit)[:, None], base + offset * (limit / np.maximum(reach, 1e-12))[:, None], corner)
+
+    # Free ends get a second corner on the right face
+    ends = np.flatnonzero(degree[origin] == 1)
+    right_id = prev_edge.copy()
+    right_id[ends] = len(origin) + np.arange(len(ends))
+    corners = np.vstack((corner, base[ends] - normal[ends] * half))
+    corners = np.column_stack((corners, coords[np.concatenate((origin, origin[ends])), 2]))
+
+    # Each wall runs up its right face and back down its left face
+    h = np.arange(0, len(origin), 2)
+    quads = np.column_stack((right_id[h], h + 1, right_id[h + 1], h))
+
+    hub_edges = order[degree[origin[order]] >= 3]
+    hub_sizes = degree[degree >= 3]
+    loop_verts = np.concatenate((quads.ravel(), hub_edges))
+    loop_starts = np.concatenate((np.arange(0, quads.size, 4), quads.size + np.cumsum(hub_sizes) - hub_sizes))
+    return corners, loop_verts, loop_starts
+
+
+def extrude_footprint(corners, loop_verts, loop_starts, height):
+    """Extrudes footprint polygons into a closed solid.
+
+    Returns (verts, loop_verts, loop_starts): bottom and top copies of every
+    polygon plus a side quad on every footprint edge used by one polygon.
+    """
+    count = len(corners)
+    sizes = np.diff(np.append(loop_starts, len(loop_verts)))
+    polygon = np.repeat(np.arange(len(loop_starts)), sizes)
+    within = np.arange(len(loop_verts)) - loop_starts[polygon]
+    following = loop_verts[loop_starts[polygon] + (within + 1) % sizes[polygon]]
+
+    # Outline edges: keys seen once, kept in their polygon's direction
+    keys = np.sort(np.column_stack((loop_verts, following)), axis=1)
+    _, inverse, uses = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    outline = uses[inverse.ravel()] == 1
+    a, b = loop_verts[outline], following[outline]
+    sides = np.column_stack((a, b, b + count, a + count))
+
+    bottom = loop_verts[loop_starts[polygon] + (sizes[polygon] - 1 - within)]
+    verts = np.vstack((corners, corners + (0.0, 0.0, height)))
+    out_verts = np.concatenate((bottom, loop_verts + count, sides.ravel()))
+    out_starts = np.concatenate((
+        loop_starts,
+        loop_starts + len(loop_verts),
+        2 * len(loop_verts) + np.arange(0, sides.size, 4),
+    ))
+    return verts, out_verts, out_starts
+
+
+# Growing edge networks: drafted and imported linework is appended segment
+# by segment. The vertex and edge buffers double their capacity when full,
+# so an append costs amortized O(1) instead of a copy of everything so far.
+# Endpoints are welded through a dict of vertices keyed by their cell on a
+# grid twice the weld tolerance wide. A point's tolerance ball overlaps at
+# most two cells per axis, so the eight cells on its side of each cell
+# centre hold every vertex it can weld to; the nearest of them within the
+# tolerance is used. Cells are hashed to one integer each, and since every
+# candidate's distance is checked, hash collisions cost time, never
+# correctness. Repeated edges are dropped.
+
+# Offsets from a point's own cell to the eight cells its tolerance ball can reach
+CELL_NEIGHBOURS = tuple((x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1))
+CELL_HASH = (73856093, 19349663, 83492791)
+FAST_WELD_POINTS = 1024  # Smaller batches are all welded point by point
+
+
+def unique_rows(points):
+    """(unique rows, inverse) of an (N, 3) array; a lexsort, cheaper than np.unique(axis=0)"""
+    order = np.lexsort(points.T[::-1])
+    ordered = points[order]
+    first = np.ones(len(points), dtype=bool)
+    first[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+    inverse = np.empty(len(points), dtype=np.int64)
+    inverse[order] = np.cumsum(first) - 1
+    return ordered[first], inverse
+
+
+class WeldedEdges:
+    """An edge network that grows by appending segments, welding shared endpoints"""
+
+    def __init__(self, coords=(), edges=(), tolerance=1e-4):
+        self.tolerance = tolerance
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.coord_buffer = np.empty((max(len(coords), 64), 3))
+        self.edge_buffer = np.empty((max(len(edges), 64), 2), dtype=np.int64)
+        self.vert_count = self.edge_count = 0
+        self.cells = {}
+        self.edge_keys = set()
+
+        self.add_verts(coords)
+        for index, (key, point) in enumerate(zip(self.cell_keys(coords).tolist(), coords.tolist())):
+            self.cells.setdefault(key, []).append((index, point))
+        self.add_edges(edges)
+
+    @property
+    def coords(self):
+        return self.coord_buffer[:self.vert_count]
+
+    @property
+    def edges(self):
+        return self.edge_buffer[:self.edge_count]
+
+    def cell_keys(self, points, neighbours=False):
+        """Hashed cell of each of the (N, 3) points, or (N, 8) hashes of the cells within the tolerance"""
+        scaled = np.asarray(points).reshape(-1, 3) / (2 * self.tolerance)
+        cells = np.floor(scaled).astype(np.int64)
+        if neighbours:
+            sides = np.where(scaled - cells < 0.5, -1, 1)
+            cells = cells[:, None, :] + sides[:, None, :] * np.array(CELL_NEIGHBOURS)
+        return np.bitwise_xor.reduce(cells * np.array(CELL_HASH), axis=-1)
+
+    @staticmethod
+    def grown(buffer, needed):
+        """buffer, or a copy with at least double the capacity when needed exceeds it"""
+        if needed <= len(buffer):
+            return buffer
+        larger = np.empty((max(2 * len(buffer), needed),) + buffer.shape[1:], dtype=buffer.dtype)
+        larger[:len(buffer)] = buffer
+        return larger
+
+    def add_verts(self, points):
+        start = self.vert_count
+        self.coord_buffer = self.grown(self.coord_buffer, start + len(points))
+        self.coord_buffer[start:start + len(points)] = points
+        self.vert_count += len(points)
+        return np.arange(start, self.vert_count)
+
+    def add_edges(self, edges):
+        """Appends the (E, 2) edges that are not already present. Returns how many were new."""
+        fresh = []
+        for a, b in edges.tolist():
+            key = (a, b) if a < b else (b, a)
+            if a != b and key not in self.edge_keys:
+                self.edge_keys.add(key)
+                fresh.append(key)
+
+        start = self.edge_count
+        self.edge_buffer = self.grown(self.edge_buffer, start + len(fresh))
+        self.edge_buffer[start:start + len(fresh)] = np.array(fresh, dtype=np.int64).reshape(-1, 2)
+        self.edge_count += len(fresh)
+        return len(fresh)
+
+    def weld(self, points):
+        """Vertex indices for (N, 3) points, adding the ones not within the tolerance of an existing vertex"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        unique, inverse = unique_rows(points)
+        own = self.cell_keys(unique)
+        neighbours = self.cell_keys(unique, neighbours=True)
+
+        # In large batches, points with nothing else in reach, in the batch or
+        # the network, are found with sorted arrays and added outright
+        crowded = np.ones(len(unique), dtype=bool)
+        if len(unique) >= max(FAST_WELD_POINTS, len(self.cells) // 8):
+            batch = np.sort(own)
+            reach = np.searchsorted(batch, neighbours, "right") - np.searchsorted(batch, neighbours, "left")
+            crowded = reach.sum(axis=1) > 1  # Every point is in reach of itself
+            if self.cells:
+                occupied = np.sort(np.fromiter(self.cells, dtype=np.int64, count=len(self.cells)))
+                found = occupied[np.minimum(np.searchsorted(occupied, neighbours), len(occupied) - 1)] == neighbours
+                crowded |= found.any(axis=1)
+
+        indices = np.empty(len(unique), dtype=np.int64)
+        isolated = np.flatnonzero(~crowded)
+        indices[isolated] = self.add_verts(unique[isolated])
+        for index, key, point in zip(indices[isolated].tolist(), own[isolated].tolist(), unique[isolated].tolist()):
+            self.cells.setdefault(key, []).append((index, point))
+
+        limit = self.tolerance ** 2
+        cells = self.cells
+        crowded = np.flatnonzero(crowded)
+        new = []
+        for i, point, key, keys in zip(
+            crowded.tolist(), unique[crowded].tolist(), own[crowded].tolist(), neighbours[crowded].tolist()
+        ):
+            x, y, z = point
+            index, best = None, limit
+            for cell in keys:
+                for vertex, (vx, vy, vz) in cells.get(cell, ()):
+                    distance = (vx - x) ** 2 + (vy - y) ** 2 + (vz - z) ** 2
+                    if distance <= best:
+                        index, best = vertex, distance
+            if index is None:
+                index = self.vert_count + len(new)
+                cells.setdefault(key, []).append((index, point))
+                new.append(i)
+            indices[i] = index
+        self.add_verts(unique[new])
+        return indices[inverse]
+
+    def append(self, starts, ends):
+        """Appends (N, 3) start and end points as edges. Returns how many edges were new."""
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+        keep = np.linalg.norm(ends - starts, axis=1) > self.tolerance  # Drop segments shorter than a weld
+        starts, ends = starts[keep], ends[keep]
+        ids = self.weld(np.vstack((starts, ends)))
+        return self.add_edges(np.column_stack((ids[:len(starts)], ids[len(starts):])))
+
+# Form finding: force density method. Every edge pulls its nodes together
+# with force = force_density * length; pinned nodes stay put and the free
+# nodes settle where those forces balance the loads. The linear system is
+# solved matrix-free with Jacobi-preconditioned conjugate gradients, one
+# bincount per coordinate over the edge arrays per iteration.
+
+def form_find(coords, edges, fixed, force_density, loads=None, tolerance=1e-6, max_iterations=10000):
+    """Returns (equilibrium coords, iterations) for an (N, 3) coords array.
+
+    edges is (E, 2), fixed a boolean mask or index array of pinned nodes,
+    force_density a scalar or (E,) array and loads an optional (N, 3) array
+    of nodal forces. Raises ValueError when a free node has no edge with a
+    force density to hold it, as its position is then undetermined.
+    """
+    coords = np.array(coords, dtype=np.float64)
+    n = len(coords)
+    force_density = np.broadcast_to(np.asarray(force_density, dtype=np.float64), (len(edges),))
+    free = np.ones(n, dtype=bool)
+    free[fixed] = False
+    if loads is None:
+        loads = np.zeros((n, 3))
+
+    # Each edge in both directions, split by whether the neighbour is free
+    index = np.cumsum(free) - 1
+    n_free = int(free.sum())
+    rows = np.concatenate((edges[:, 0], edges[:, 1]))
+    cols = np.concatenate((edges[:, 1], edges[:, 0]))
+    weights = np.concatenate((force_density, force_density))
+    rows_free = free[rows]
+    diag = np.bincount(index[rows[rows_free]], weights[rows_free], n_free)
+    if n_free == 0:
+        return coords, 0
+    if not diag.all():
+        raise ValueError(f"{int((diag == 0).sum())} free nodes have no edges to hold them")
+
+    to_fixed = rows_free & ~free[cols]
+    to_free = rows_free & free[cols]
+    fixed_rows, fixed_cols, fixed_weights = index[rows[to_fixed]], cols[to_fixed], weights[to_fixed]
+    free_rows, free_cols, free_weights = index[rows[to_free]], index[cols[to_free]], weights[to_free]
+
+    # Component-major (3, n_free) arrays keep the gathers contiguous
+    b = np.array([
+        loads[free, k] + np.bincount(fixed_rows, fixed_weights * coords[fixed_cols, k], n_free)
+        for k in range(3)
+    ])
+
+    def apply(y):
+        return diag * y - np.array([np.bincount(free_rows, free_weights * yk[free_cols], n_free) for yk in y])
+
+    y = np.ascontiguousarray(coords[free].T)
+    r = b - apply(y)
+    inv_diag = 1.0 / diag
+    z = inv_diag * r
+    p = z.copy()
+    rz = (r * z).sum(axis=1)
+    b_norm = np.linalg.norm(b, axis=1) + 1e-300
+
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        if (np.linalg.norm(r, axis=1) <= tolerance * b_norm).all():
+            break
+        ap = apply(p)
+        alpha = rz / np.maximum((p * ap).sum(axis=1), 1e-300)
+        y += alpha[:, None] * p
+        r -= alpha[:, None] * ap
+        z = inv_diag * r
+        rz_new = (r * z).sum(axis=1)
+        p = z + (rz_new / np.maximum(rz, 1e-300))[:, None] * p
+        rz = rz_new
+
+    coords[free] = y.T
+    return coords, iterations
+
+
+class ForceDensitySolver:
+    """Force density solver for one membrane topology and set of supports.
+
+    The sparse branch-node connectivity matrix is assembled once. The
+    free-node system is factorized for the first force densities solved,
+    and that factorization is kept, so a later solve with the same force
+    densities is a direct solve. Other force densities, such as the later
+    prestress passes, are first solved by a conjugate gradient
+    preconditioned with the most recent factorization; only when that does
+    not converge within PRECONDITIONED_ITERATIONS is the system factorized
+    again. Without SciPy each solve falls back to form_find's conjugate
+    gradient. Like form_find, it raises ValueError when a free node has no
+    edges.
+    """
+
+    def __init__(self, n_nodes, edges, fixed):
+        self.edges = edges
+        self.free = np.ones(n_nodes, dtype=bool)
+        self.free[fixed] = False
+        loose = self.free & (np.bincount(edges.ravel(), minlength=n_nodes) == 0)
+        if loose.any():
+            raise ValueError(f"{int(loose.sum())} free nodes have no edges to hold them")
+        self._factors = []  # (force densities, factorization): the first and the most recent
+
+        if scipy is not None:
+            importlib.import_module("scipy.sparse.linalg")
+            n_edges = len(edges)
+            connectivity = scipy.sparse.csr_matrix(
+                (np.tile([1.0, -1.0], n_edges), (np.repeat(np.arange(n_edges), 2), edges.ravel())),
+                shape=(n_edges, n_nodes),
+            )
+            self.c_free = connectivity[:, self.free]
+            self.c_fixed = connectivity[:, ~self.free]
+
+    def system(self, force_density):
+        """The free-node stiffness matrix C_free^T Q C_free"""
+        return (self.c_free.T @ scipy.sparse.diags(force_density) @ self.c_free).tocsc()
+
+    def solve(self, coords, force_density, loads):
+        """Returns the equilibrium coords for the given (E,) force densities"""
+        if scipy is None:
+            return form_find(coords, self.edges, ~self.free, force_density, loads)[0]
+
+        coords = coords.copy()
+        rhs = loads[self.free] - self.c_free.T @ (force_density[:, None] * (self.c_fixed @ coords[~self.free]))
+        for factored, factor in self._factors:
+            if np.array_equal(force_density, factored):
+                coords[self.free] = factor.solve(rhs)
+                return coords
+
+        system = self.system(force_density)
+        if self._factors:
+            solution = preconditioned_cg(system, rhs, coords[self.free], self._factors[-1][1].solve)
+            if solution is not None:
+                coords[self.free] = solution
+                return coords
+
+        factor = scipy.sparse.linalg.splu(system)
+        self._factors = self._factors[:1] + [(force_density.copy(), factor)]
+        coords[self.free] = factor.solve(rhs)
+        return coords
+
+
+# A preconditioned iteration costs a pair of triangular solves, roughly a
+# fifteenth of a factorization, so the conjugate gradient gets a few of
+# them before the system is factorized afresh.
+PRECONDITIONED_ITERATIONS = 8
+
+
+def preconditioned_cg(system, rhs, y, precondition, tolerance=1e-6, max_iterations=PRECONDITIONED_ITERATIONS):
+    """Solves system @ y = rhs for (n, 3) columns from the guess y, or returns None when it doesn't converge"""
+    r = rhs - system @ y
+    z = precondition(r)
+    p = z.copy()
+    rz = (r * z).sum(axis=0)
+    b_norm = np.linalg.norm(rhs, axis=0) + 1e-300
+
+    for _ in range(max_iterations):
+        if (np.linalg.norm(r, axis=0) <= tolerance * b_norm).all():
+            return y
+        ap = system @ p
+        alpha = rz / np.maximum((p * ap).sum(axis=0), 1e-300)
+        y = y + alpha * p
+        r = r - alpha * ap
+        z = precondition(r)
+        rz_new = (r * z).sum(axis=0)
+        p = z + (rz_new / np.maximum(rz, 1e-300)) * p
+        rz = rz_new
+    return y if (np.linalg.norm(r, axis=0) <= tolerance * b_norm).all() else None
+
+
+# The last solver is kept between calls, so re-running a form-find on the
+# same membrane and supports (say with a new fabric weight from the redo
+# panel) skips the connectivity assembly and the factorization.
+_solver_cache = {}
+
+
+def force_density_solver(n_nodes, edges, fixed):
+    """The ForceDensitySolver for this topology and set of supports, reused between calls"""
+    pinned = np.zeros(n_nodes, dtype=bool)
+    pinned[fixed] = True
+    key = hashlib.sha1(np.ascontiguousarray(edges, dtype=np.int64).tobytes() + np.packbits(pinned).tobytes()).hexdigest()
+    solver = _solver_cache.get((n_nodes, key))
+    if solver is None:
+        _solver_cache.clear()  # One membrane at a time, its factorization can be large
+        solver = _solver_cache[(n_nodes, key)] = ForceDensitySolver(n_nodes, edges, fixed)
+    return solver
+
+
+def edge_lengths(coords, edges):
+    """(E,) lengths of the (E, 2) edges over (N, 3) coords"""
+    return np.linalg.norm(coords[edges[:, 1]] - coords[edges[:, 0]], axis=1)
+
+
+# How far the prestress iteration may move an edge's force density from its
+# initial value. Edges into point supports shrink towards zero length and
+# would otherwise take the system singular.
+FORCE_DENSITY_RANGE = 100.0
+
+
+def find_prestressed_form(coords, edges, fixed, target_forces, loads, iterations=10, tolerance=1e-3):
+    """Iterates the force densities towards a target force in every edge.
+
+    Each pass solves with q = target / length from the previous shape. Edges
+    into point supports can't all reach their target, so convergence is
+    judged on the mean relative error, and the iteration stops once a pass
+    no longer improves on it. Returns (coords, edge forces, passes, mean
+    relative error) of the best pass.
+    """
+    solver = force_density_solver(len(coords), edges, fixed)
+    initial = target_forces / np.maximum(edge_lengths(coords, edges), 1e-9)
+    force_density = initial
+    best = None
+    for passes in range(1, iterations + 1):
+        coords = solver.solve(coords, force_density, loads)
+        lengths = edge_lengths(coords, edges)
+        forces = force_density * lengths
+        error = np.mean(np.abs(forces - target_forces) / target_forces)
+        previous = np.inf if best is None else best[2]
+        if best is None or error < previous:
+            best = (coords, forces, error)
+        if error <= tolerance or error >= previous * (1.0 - tolerance):
+            break
+        force_density = np.clip(
+            target_forces / np.maximum(lengths, 1e-9),
+            initial / FORCE_DENSITY_RANGE, initial * FORCE_DENSITY_RANGE
+        )
+
+    coords, forces, error = best
+    return coords, forces, passes, error
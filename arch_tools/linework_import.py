@@ -0,0 +1,205 @@
+# Linework Import: streams LINE and LWPOLYLINE entities from ASCII DXF files,
+# or segments from CSV files, into one welded edge mesh per layer.
+#
+# The file is read as a pipeline of generators: group code pairs, then
+# entities, then segments, then per-layer batches. At most BATCH_SIZE
+# segments are buffered at a time, so parsing memory does not grow with the
+# file or its layer count; the welded layer meshes are the only thing that
+# does. Each layer is a drafting layer (see drafting_tools.DraftingLayer),
+# so the result can be drawn on with the drafting tools and turned into
+# walls with Edge To Wall.
+#
+# CSV rows are layer,x1,y1,x2,y2 or layer,x1,y1,z1,x2,y2,z2; a header row
+# is skipped.
+
+import bpy
+import csv
+import os
+from bpy_extras.io_utils import ImportHelper
+
+from . import lazy_import
+from .drafting_tools import LAYER_WELD_DISTANCE, DraftingLayer
+
+np = lazy_import("numpy")
+
+BATCH_SIZE = 65536  # Segments buffered, over all layers, before they are welded in
+DXF_ENTITIES = {"LINE", "LWPOLYLINE"}
+
+
+def dxf_pairs(file):
+    """Yields (group code, value) pairs from an ASCII DXF file"""
+    while True:
+        code = file.readline()
+        value = file.readline()
+        if not value:
+            return
+        yield int(code), value.strip()
+
+
+def dxf_entities(pairs):
+    """Yields (type, [(code, value), ...]) for the LINE and LWPOLYLINE entities of the ENTITIES section"""
+    section = None
+    kind, entity = None, None
+    for code, value in pairs:
+        if code != 0:
+            if code == 2 and section == "":
+                section = value
+            elif entity is not None:
+                entity.append((code, value))
+            continue
+
+        if entity is not None:
+            yield kind, entity
+        kind, entity = value, None
+        if value == "SECTION":
+            section = ""
+        elif value == "ENDSEC":
+            section = None
+        elif section == "ENTITIES" and value in DXF_ENTITIES:
+            entity = []
+    if entity is not None:
+        yield kind, entity
+
+
+def dxf_segments(file):
+    """Yields (layer, start, end) for every straight segment of the DXF's lines and polylines.
+
+    Polyline bulges are drawn as chords, and coordinates are taken as world
+    coordinates (entities with a tilted extrusion direction are not
+    transformed).
+    """
+    if file.read(18) == "AutoCAD Binary DXF":
+        raise ValueError("Binary DXF is not supported, save the drawing as ASCII DXF")
+    file.seek(0)
+
+    for kind, entity in dxf_entities(dxf_pairs(file)):
+        layer = "0"
+        if kind == "LINE":
+            point = {10: 0.0, 20: 0.0, 30: 0.0, 11: 0.0, 21: 0.0, 31: 0.0}
+            for code, value in entity:
+                if code == 8:
+                    layer = value
+                elif code in point:
+                    point[code] = float(value)
+            yield layer, (point[10], point[20], point[30]), (point[11], point[21], point[31])
+        else:
+            xs, ys, elevation, closed = [], [], 0.0, False
+            for code, value in entity:
+                if code == 8:
+                    layer = value
+                elif code == 10:
+                    xs.append(float(value))
+                elif code == 20:
+                    ys.append(float(value))
+                elif code == 38:
+                    elevation = float(value)
+                elif code == 70:
+                    closed = bool(int(value) & 1)
+            points = [(x, y, elevation) for x, y in zip(xs, ys)]
+            if closed and len(points) > 2:
+                points.append(points[0])
+            for start, end in zip(points, points[1:]):
+                yield layer, start, end
+
+
+def csv_segments(file):
+    """Yields (layer, start, end) for every row of a linework CSV file"""
+    for row in csv.reader(file):
+        try:
+            values = [float(v) for v in row[1:]]
+        except ValueError:
+            continue  # Header or malformed row
+        if len(values) == 4:
+            yield row[0], (values[0], values[1], 0.0), (values[2], values[3], 0.0)
+        elif len(values) == 6:
+            yield row[0], tuple(values[:3]), tuple(values[3:])
+
+
+def layer_batches(segments, layers=None, size=BATCH_SIZE):
+    """Groups (layer, start, end) segments into (layer, starts, ends) arrays.
+
+    At most size segments are buffered across all layers; when the buffer
+    fills, every layer's segments are handed on. Only layers in layers are
+    kept, when it is given.
+    """
+    pending, count = {}, 0
+    for layer, start, end in segments:
+        if layers and layer not in layers:
+            continue
+        pending.setdefault(layer, []).append(start + end)
+        count += 1
+        if count >= size:
+            yield from flush_batches(pending)
+            pending, count = {}, 0
+    yield from flush_batches(pending)
+
+
+def flush_batches(pending):
+    for layer, batch in pending.items():
+        array = np.array(batch, dtype=np.float64)
+        yield layer, array[:, :3], array[:, 3:]
+
+
+def import_linework(context, filepath, layers=None, scale=1.0, weld_distance=LAYER_WELD_DISTANCE):
+    """Streams a DXF or CSV file into one drafting layer mesh per layer. Returns {layer: edges added}."""
+    is_dxf = os.path.splitext(filepath)[1].lower() == ".dxf"
+    reader = dxf_segments if is_dxf else csv_segments
+
+    targets, added = {}, {}
+    with open(filepath, encoding="utf-8", errors="replace", newline=None if is_dxf else "") as file:
+        for layer, starts, ends in layer_batches(reader(file), layers):
+            if layer not in targets:
+                targets[layer] = DraftingLayer.get(context, layer, weld_distance)
+                added[layer] = 0
+            added[layer] += targets[layer].append(starts * scale, ends * scale, sync=False)
+
+    for target in targets.values():
+        target.sync()
+    return added
+
+
+class ImportLinework(bpy.types.Operator, ImportHelper):
+    bl_idname = "import_scene.arch_linework"
+    bl_label = "Import Linework (.dxf/.csv)"
+    bl_description = "Import DXF lines and polylines, or CSV segments, as one edge mesh per layer"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filter_glob: bpy.props.StringProperty(default="*.dxf;*.csv", options={'HIDDEN'})
+    layers: bpy.props.StringProperty(name="Layers", description="Comma-separated layer names to import (empty for all)")
+    scale: bpy.props.FloatProperty(name="Scale", default=1.0, min=1e-6, description="Drawing units to metres, e.g. 0.001 for millimetres")
+    weld_distance: bpy.props.FloatProperty(
+        name="Weld Distance", default=LAYER_WELD_DISTANCE, min=1e-9, precision=6, unit='LENGTH',
+        description="Endpoints closer than this share a vertex",
+    )
+
+    def execute(self, context):
+        if np is None:
+            self.report({'ERROR'}, "Linework import needs NumPy")
+            return {'CANCELLED'}
+
+        layers = {name.strip() for name in self.layers.split(",") if name.strip()}
+        try:
+            added = import_linework(context, self.filepath, layers, self.scale, self.weld_distance)
+        except (OSError, ValueError) as error:
+            self.report({'ERROR'}, f"Could not import {os.path.basename(self.filepath)}: {error}")
+            return {'CANCELLED'}
+
+        if not added:
+            self.report({'WARNING'}, "No lines found on the chosen layers")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Imported {sum(added.values())} edges on {len(added)} layers")
+        return {'FINISHED'}
+
+
+def menu_func_import(self, context):
+    self.layout.operator(ImportLinework.bl_idname, text="Linework (.dxf/.csv)")
+
+
+def register():
+    bpy.utils.register_class(ImportLinework)
+    bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+
+
+def unregister():
+    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+    bpy.utils.unregister_class(ImportLinework)
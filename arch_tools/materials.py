@@ -0,0 +1,40 @@
+# Generated materials are shared between runs and generators. Each carries
+# its parameter key as a "material_key" custom property, so one Principled
+# BSDF node tree exists per unique set of values.
+
+import bpy
+
+_material_cache = {}
+
+
+def material_key(base_color, metallic=0.0, roughness=0.5):
+    return repr((tuple(round(c, 4) for c in base_color), round(metallic, 4), round(roughness, 4)))
+
+
+def cached_material(name, base_color, metallic=0.0, roughness=0.5):
+    """Returns the shared Principled BSDF material for these values, creating it once"""
+    key = material_key(base_color, metallic, roughness)
+    mat = bpy.data.materials.get(_material_cache.get(key, ""))
+    if mat is None or mat.get("material_key") != key:
+        mat = next((m for m in bpy.data.materials if m.get("material_key") == key), None)
+
+    if mat is None:
+        mat = bpy.data.materials.new(name=name)
+        mat.use_nodes = True
+        bsdf = mat.node_tree.nodes.get("Principled BSDF")
+        if bsdf:
+            bsdf.inputs["Base Color"].default_value = base_color
+            bsdf.inputs["Metallic"].default_value = metallic
+            bsdf.inputs["Roughness"].default_value = roughness
+        mat["material_key"] = key
+
+    _material_cache[key] = mat.name
+    return mat
+
+
+def remove_orphan_materials():
+    """Frees generated materials that no object uses any more"""
+    for mat in list(bpy.data.materials):
+        if "material_key" in mat and mat.users == 0:
+            _material_cache.pop(mat["material_key"], None)
+            bpy.data.materials.remove(mat)
@@ -0,0 +1,169 @@
+# Writing kernel arrays into Blender meshes, and replacing generated output.
+
+import bpy
+
+from . import kernel, lazy_import
+
+np = lazy_import("numpy")
+
+
+def write_mesh_loops(mesh, verts, loop_verts, loop_starts):
+    """Writes vertices, loop vertex indices and polygon loop starts into an empty mesh"""
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", np.asarray(verts, dtype=np.float32).ravel())
+
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", np.asarray(loop_verts, dtype=np.int32))
+
+    mesh.polygons.add(len(loop_starts))
+    mesh.polygons.foreach_set("loop_start", np.asarray(loop_starts, dtype=np.int32))
+
+    mesh.update(calc_edges=True)
+
+
+def write_mesh_data(mesh, verts, faces):
+    """Writes vertex and face arrays into an empty mesh in one bulk step.
+
+    faces is an (F, S) array of vertex indices, S sides per face.
+    """
+    write_mesh_loops(mesh, verts, *kernel.face_loops(faces))
+
+
+# foreach_set only writes a whole collection, so a bulk write of a few new
+# elements means reading back and rewriting everything before them.
+# Assigning elements one at a time touches only the new ones, but each
+# costs roughly as much as ELEMENT_WRITE_COST elements passed in bulk, so
+# it is used for tails shorter than that fraction of their collection.
+ELEMENT_WRITE_COST = 100
+
+
+def write_tail(collection, attr, start, values):
+    """Writes values, one per element, into collection[start:].
+
+    values is a (K,) or (K, width) array for the last K elements.
+    """
+    values = np.asarray(values)
+    if not len(values):
+        return
+    if len(values) * ELEMENT_WRITE_COST < len(collection):
+        for item, value in zip(collection[start:], values.tolist()):
+            setattr(item, attr, value)
+        return
+
+    width = values.size // len(values)
+    data = np.empty(len(collection) * width, dtype=values.dtype)
+    if start:
+        collection.foreach_get(attr, data)
+    data[start * width:] = values.ravel()
+    collection.foreach_set(attr, data)
+
+
+def append_mesh_data(mesh, verts, faces, material_indices=None):
+    """Appends vertex and face arrays to a mesh, leaving its geometry in place.
+
+    faces indexes into verts, not the whole mesh, and material_indices
+    optionally gives the new faces' material slots. Only the appended
+    elements are written, see write_tail.
+    """
+    n_verts, n_loops, n_polygons = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+    loop_verts, loop_starts = kernel.face_loops(faces)
+
+    mesh.vertices.add(len(verts))
+    write_tail(mesh.vertices, "co", n_verts, np.asarray(verts, dtype=np.float32).reshape(-1, 3))
+    mesh.loops.add(len(loop_verts))
+    write_tail(mesh.loops, "vertex_index", n_loops, (loop_verts + n_verts).astype(np.int32))
+    mesh.polygons.add(len(loop_starts))
+    write_tail(mesh.polygons, "loop_start", n_polygons, (loop_starts + n_loops).astype(np.int32))
+    if material_indices is not None:
+        write_tail(mesh.polygons, "material_index", n_polygons, np.asarray(material_indices, dtype=np.int32))
+
+    mesh.update(calc_edges=True)
+
+
+def truncate_mesh_data(mesh, n_verts, n_polygons):
+    """Keeps the first n_verts vertices and n_polygons faces of a mesh.
+
+    The kept faces may only use the kept vertices. A mesh cannot drop
+    elements, so the kept prefix is read out, the geometry cleared and the
+    prefix written back as it was: positions, faces and material indices.
+    """
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    n_loops = loop_start[n_polygons] if n_polygons < len(loop_start) else len(mesh.loops)
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    vertex_index = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vertex_index)
+
+    mesh.clear_geometry()
+    write_mesh_loops(mesh, co[:n_verts * 3].reshape(-1, 3), vertex_index[:n_loops], loop_start[:n_polygons])
+    mesh.polygons.foreach_set("material_index", material_index[:n_polygons])
+
+
+# Generated output is replaced in place: the previous object and mesh are
+# reused when possible and freed otherwise, so repeated runs do not leave
+# orphan mesh datablocks behind. Reclaimed sizes are tallied per generator
+# in the scene's "reclaimed_bytes" property.
+def mesh_bytes(mesh):
+    """Rough size of a mesh's geometry arrays in bytes"""
+    return (
+        len(mesh.vertices) * 12  # Positions
+        + len(mesh.edges) * 8  # Edge vertex pairs
+        + len(mesh.loops) * 8  # Loop vertex and edge indices
+        + len(mesh.polygons) * 4  # Face offsets
+    )
+
+
+def record_reclaimed(generator, size):
+    scene = bpy.context.scene
+    stats = dict(scene.get("reclaimed_bytes", {}))
+    stats[generator] = stats.get(generator, 0) + size
+    scene["reclaimed_bytes"] = stats
+
+
+def remove_output(obj_name, generator):
+    """Removes a generated object and frees its mesh if nothing else uses it"""
+    obj = bpy.data.objects.get(obj_name)
+    if obj is None:
+        return
+
+    mesh = obj.data if obj.type == 'MESH' else None
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if mesh is not None and mesh.users == 0:
+        record_reclaimed(generator, mesh_bytes(mesh))
+        bpy.data.meshes.remove(mesh)
+
+
+def move_to_collection(obj, collection):
+    """Links obj into collection and unlinks it from every other collection"""
+    if collection not in obj.users_collection:
+        collection.objects.link(obj)
+    for other in obj.users_collection:
+        if other != collection:
+            other.objects.unlink(obj)
+
+
+def replace_output(context, obj_name, mesh_name, generator, collection=None):
+    """Returns (obj, mesh) for a generator's output, with the mesh emptied.
+
+    The existing object and its mesh are reused in place when the mesh is
+    not shared; otherwise the old output is freed and a new one is linked
+    to collection (the active collection by default). A reused object is
+    moved into collection when one is given, and otherwise stays where it
+    is.
+    """
+    obj = bpy.data.objects.get(obj_name)
+    if obj is not None and obj.type == 'MESH' and obj.data.users == 1:
+        mesh = obj.data
+        mesh.clear_geometry()  # Emptied, not removed, so nothing is reclaimed
+        if collection is not None:
+            move_to_collection(obj, collection)
+        return obj, mesh
+
+    remove_output(obj_name, generator)
+    mesh = bpy.data.meshes.new(mesh_name)
+    obj = bpy.data.objects.new(obj_name, mesh)
+    (collection or context.collection).objects.link(obj)
+    return obj, mesh
@@ -0,0 +1,100 @@
+# Orphan Data Report: reports the mesh data reclaimed by the generators and
+# frees leftover orphan meshes.
+
+import bpy
+
+from .mesh_utils import mesh_bytes
+
+
+def format_bytes(size):
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def orphan_meshes():
+    return [mesh for mesh in bpy.data.meshes if mesh.users == 0]
+
+
+class GeneratorOrphanReportOperator(bpy.types.Operator):
+    bl_idname = "wm.generator_orphan_report"
+    bl_label = "Reclaimed Data Report"
+    bl_description = "Show the mesh data reclaimed by each generator"
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_popup(self, width=320)
+
+    def draw(self, context):
+        layout = self.layout
+        stats = context.scene.get("reclaimed_bytes", {})
+
+        layout.label(text="Reclaimed per generator:")
+        col = layout.column(align=True)
+        if not stats:
+            col.label(text="Nothing reclaimed yet")
+        for generator, size in sorted(stats.items()):
+            row = col.row()
+            row.label(text=generator)
+            row.label(text=format_bytes(size))
+
+        orphans = orphan_meshes()
+        layout.separator()
+        layout.label(text=f"Orphan meshes left: {len(orphans)} ({format_bytes(sum(mesh_bytes(m) for m in orphans))})")
+
+    def execute(self, context):
+        stats = context.scene.get("reclaimed_bytes", {})
+        for generator, size in sorted(stats.items()):
+            self.report({'INFO'}, f"{generator}: {format_bytes(size)} reclaimed")
+        return {'FINISHED'}
+
+
+class PurgeOrphanMeshesOperator(bpy.types.Operator):
+    bl_idname = "wm.purge_orphan_meshes"
+    bl_label = "Purge Orphan Meshes"
+    bl_description = "Free mesh datablocks that no object uses"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        orphans = orphan_meshes()
+        size = sum(mesh_bytes(mesh) for mesh in orphans)
+        for mesh in orphans:
+            bpy.data.meshes.remove(mesh)
+
+        stats = dict(context.scene.get("reclaimed_bytes", {}))
+        stats["Orphan Purge"] = stats.get("Orphan Purge", 0) + size
+        context.scene["reclaimed_bytes"] = stats
+
+        self.report({'INFO'}, f"Freed {len(orphans)} orphan meshes ({format_bytes(size)})")
+        return {'FINISHED'}
+
+
+class OrphanDataReportPanel(bpy.types.Panel):
+    bl_label = "Orphan Data Report"
+    bl_idname = "VIEW3D_PT_orphan_data_report"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Orphan Data"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator("wm.generator_orphan_report")
+        layout.operator("wm.purge_orphan_meshes")
+
+
+classes = [
+    GeneratorOrphanReportOperator,
+    PurgeOrphanMeshesOperator,
+    OrphanDataReportPanel,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,162 @@
+# Snapping for the drafting tools: endpoint, midpoint and intersection snaps
+# over scene edges, in plan (XY).
+#
+# Endpoints and edge midpoints sit in mathutils KD-trees and edges in a
+# uniform grid hash, all built once per drafting session. A KD-tree cannot
+# take points after it is balanced, so lines drawn during the session are
+# kept in a small pending array that is searched directly, and folded into
+# a rebuild once it grows past PENDING_LIMIT.
+
+from mathutils.kdtree import KDTree
+
+from . import lazy_import
+
+np = lazy_import("numpy")
+
+SNAP_KINDS = ("ENDPOINT", "INTERSECTION", "MIDPOINT")  # In priority order
+PENDING_LIMIT = 1024
+MAX_CELLS_PER_EDGE = 256  # Longer edges are checked directly on every query
+MAX_QUERY_CELLS = 1024  # Beyond this the view is zoomed too far out for intersections
+
+
+def plan_tree(points):
+    """A balanced KD-tree over the XY of (N, 3) points"""
+    tree = KDTree(len(points))
+    for index, (x, y) in enumerate(points[:, :2].tolist()):
+        tree.insert((x, y, 0.0), index)
+    tree.balance()
+    return tree
+
+
+def segment_distances(segments, point):
+    """XY distance from point to each of the (S, 2, 3) segments"""
+    a = segments[:, 0, :2]
+    d = segments[:, 1, :2] - a
+    length2 = np.maximum((d * d).sum(axis=1), 1e-24)
+    t = np.clip(((point - a) * d).sum(axis=1) / length2, 0.0, 1.0)
+    return np.linalg.norm(a + d * t[:, None] - point, axis=1)
+
+
+def segment_intersections(segments):
+    """Returns the (K, 3) points where pairs of (S, 2, 3) segments cross in XY.
+
+    Heights are interpolated along the first segment of each pair.
+    """
+    i, j = np.triu_indices(len(segments), 1)
+    a, b = segments[i], segments[j]
+    da = a[:, 1] - a[:, 0]
+    db = b[:, 1] - b[:, 0]
+    offset = b[:, 0, :2] - a[:, 0, :2]
+    denom = np.cross(da[:, :2], db[:, :2])
+    ok = np.abs(denom) > 1e-12
+    denom = np.where(ok, denom, 1.0)
+    t = np.cross(offset, db[:, :2]) / denom
+    u = np.cross(offset, da[:, :2]) / denom
+    ok &= (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    return a[ok, 0] + da[ok] * t[ok, None]
+
+
+class SnapIndex:
+    """Nearest endpoint, midpoint and intersection snaps for a set of segments"""
+
+    def __init__(self, points, segments):
+        self.build(np.asarray(points, dtype=np.float64).reshape(-1, 3), np.asarray(segments, dtype=np.float64).reshape(-1, 2, 3))
+
+    @classmethod
+    def from_mesh_arrays(cls, coords, edges):
+        """Index over (N, 3) vertices and the (E, 2) edges between them"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        return cls(coords, coords[np.asarray(edges, dtype=np.int64).reshape(-1, 2)])
+
+    def build(self, points, segments):
+        self.points = points
+        self.segments = segments
+        self.pending = np.empty((0, 2, 3))
+        self.point_tree = plan_tree(points)
+        self.midpoints = segments.mean(axis=1)
+        self.midpoint_tree = plan_tree(self.midpoints)
+
+        # Grid hash: every segment is listed under each cell its XY bounds touch
+        lengths = np.linalg.norm(segments[:, 1, :2] - segments[:, 0, :2], axis=1)
+        self.cell = float(np.median(lengths)) if len(lengths) else 1.0
+        self.cell = max(self.cell, 1e-6)
+        low = np.floor(segments[:, :, :2].min(axis=1) / self.cell).astype(np.int64)
+        high = np.floor(segments[:, :, :2].max(axis=1) / self.cell).astype(np.int64)
+        span = high - low + 1
+        counts = span[:, 0] * span[:, 1]
+        short = counts <= MAX_CELLS_PER_EDGE
+        self.long_segments = np.flatnonzero(~short)
+
+        ids = np.repeat(np.flatnonzero(short), counts[short])
+        within = np.arange(len(ids)) - np.repeat(np.cumsum(counts[short]) - counts[short], counts[short])
+        cx = low[ids, 0] + within % span[ids, 0]
+        cy = low[ids, 1] + within // span[ids, 0]
+        keys = self.cell_key(cx, cy)
+        order = np.argsort(keys, kind="stable")
+        self.cell_keys = keys[order]
+        self.cell_segments = ids[order]
+
+    @staticmethod
+    def cell_key(cx, cy):
+        return cx * (1 << 32) + (cy + (1 << 31))
+
+    def add_segment(self, start, end):
+        """Adds a committed line, searched directly until the next rebuild"""
+        segment = np.array((tuple(start), tuple(end)), dtype=np.float64)[None]
+        self.pending = np.concatenate((self.pending, segment))
+        if len(self.pending) >= PENDING_LIMIT:
+            self.build(np.vstack((self.points, self.pending.reshape(-1, 3))), np.vstack((self.segments, self.pending)))
+
+    def nearby_segments(self, point, radius):
+        """Segments within radius of point in XY, or None when the window is too large"""
+        low = np.floor((point - radius) / self.cell).astype(np.int64)
+        high = np.floor((point + radius) / self.cell).astype(np.int64)
+        if np.prod(high - low + 1) > MAX_QUERY_CELLS:
+            return None
+
+        cx, cy = np.meshgrid(np.arange(low[0], high[0] + 1), np.arange(low[1], high[1] + 1), indexing="ij")
+        keys = self.cell_key(cx.ravel(), cy.ravel())
+        starts = np.searchsorted(self.cell_keys, keys, side="left")
+        stops = np.searchsorted(self.cell_keys, keys, side="right")
+        ids = np.unique(np.concatenate([self.cell_segments[a:b] for a, b in zip(starts, stops)] + [self.long_segments]))
+
+        segments = np.vstack((self.segments[ids], self.pending))
+        return segments[segment_distances(segments, point) <= radius]
+
+    def nearest(self, tree, points, extra, point, radius):
+        """Closest of a KD-tree's points and extra (M, 3) points within radius, or None"""
+        best, best_dist = None, radius
+        _, index, dist = tree.find((point[0], point[1], 0.0))
+        if index is not None and dist <= best_dist:
+            best, best_dist = points[index], dist
+        if len(extra):
+            dists = np.linalg.norm(extra[:, :2] - point, axis=1)
+            i = int(np.argmin(dists))
+            if dists[i] <= best_dist:
+                best = extra[i]
+        return best
+
+    def snap(self, point, radius, kinds=SNAP_KINDS):
+        """Returns (location, kind) of the best snap within radius of an XY point, or None"""
+        point = np.asarray(point, dtype=np.float64)[:2]
+
+        if "ENDPOINT" in kinds:
+            hit = self.nearest(self.point_tree, self.points, self.pending.reshape(-1, 3), point, radius)
+            if hit is not None:
+                return hit, "ENDPOINT"
+
+        if "INTERSECTION" in kinds:
+            segments = self.nearby_segments(point, radius)
+            if segments is not None and len(segments) > 1:
+                crossings = segment_intersections(segments)
+                if len(crossings):
+                    dists = np.linalg.norm(crossings[:, :2] - point, axis=1)
+                    i = int(np.argmin(dists))
+                    if dists[i] <= radius:
+                        return crossings[i], "INTERSECTION"
+
+        if "MIDPOINT" in kinds:
+            hit = self.nearest(self.midpoint_tree, self.midpoints, self.pending.mean(axis=1), point, radius)
+            if hit is not None:
+                return hit, "MIDPOINT"
+        return None
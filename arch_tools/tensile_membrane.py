@@ -0,0 +1,205 @@
+# Tensile Membrane Structure Generator: generates a tensile membrane
+# structure with cloth simulation, and form-finds it with the force density
+# method.
+
+import bpy
+import bmesh
+import math
+from bpy.props import FloatProperty, IntProperty
+from mathutils import Matrix
+
+from . import kernel, lazy_import
+from .mesh_utils import remove_output, replace_output, write_mesh_loops
+
+np = lazy_import("numpy")  # Form-find is unavailable without NumPy, supports fall back to BMesh
+
+GENERATOR = "Tensile Membrane"
+POLE_RADIUS = 0.1
+POLE_SEGMENTS = 16
+
+def boundary_vertices(mesh):
+    """Indices of the vertices on edges used by a single face"""
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+
+    face_count = np.bincount(loop_edges, minlength=len(mesh.edges))
+    return np.unique(edges.reshape(-1, 2)[face_count == 1])
+
+class TensileGeneratorOperator(bpy.types.Operator):
+    bl_idname = "object.tensile_membrane_generate"
+    bl_label = "Generate Tensile Structure"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    size: FloatProperty(name="Size", default=5.0, min=1.0, max=10.0)
+    resolution: IntProperty(name="Resolution", default=20, min=5, max=400)
+    pole_height: FloatProperty(name="Pole Height", default=3.0, min=1.0, max=10.0)
+    posts_per_side: IntProperty(name="Posts Per Side", default=0, min=0, max=50, description="Edge posts between each pair of corner poles")
+    mast_count: IntProperty(name="Masts", default=0, min=0, max=32, description="Internal masts, one at the centre or spaced on a ring")
+    mast_height: FloatProperty(name="Mast Height", default=5.0, min=1.0, max=20.0)
+    
+    def execute(self, context):
+        obj = self.create_base_mesh()
+        support_points = self.support_points()
+        self.create_support_poles(context, support_points)
+        obj["support_points"] = support_points
+        obj["edge_supports"] = 4 * (self.posts_per_side + 1)
+        return {'FINISHED'}
+
+    def support_points(self):
+        """Tops of the corner poles, the edge posts and the internal masts, as (x, y, z).
+
+        The poles and posts come first and lie on the membrane's edge.
+        """
+        half = self.size / 2
+        corners = [(-half, -half), (half, -half), (half, half), (-half, half)]
+        steps = self.posts_per_side + 1
+        points = []
+        for side in range(4):
+            (x0, y0), (x1, y1) = corners[side], corners[(side + 1) % 4]
+            for step in range(steps):
+                t = step / steps
+                points.append((x0 + (x1 - x0) * t, y0 + (y1 - y0) * t, self.pole_height))
+
+        ring = 0.0 if self.mast_count == 1 else half / 2
+        for i in range(self.mast_count):
+            angle = 2 * math.pi * i / self.mast_count
+            points.append((ring * math.cos(angle), ring * math.sin(angle), self.mast_height))
+        return points
+    
+    def create_base_mesh(self):
+        obj, mesh = replace_output(bpy.context, "TensileStructure", "TensileMesh", GENERATOR)
+
+        bm = bmesh.new()
+        # create_grid's size is a half-width, so the corners land on the corner poles
+        bmesh.ops.create_grid(bm, x_segments=self.resolution, y_segments=self.resolution, size=self.size / 2)
+        bm.to_mesh(mesh)
+        bm.free()
+        
+        bpy.context.view_layer.objects.active = obj
+        obj.select_set(True)
+        
+        self.apply_cloth_simulation(obj)
+        return obj
+    
+    def apply_cloth_simulation(self, obj):
+        cloth = obj.modifiers.get("TensileCloth") or obj.modifiers.new(name="TensileCloth", type='CLOTH')
+        cloth.settings.mass = 0.5
+        cloth.settings.structural_stiffness = 15
+        cloth.settings.bending_stiffness = 0.1
+        cloth.settings.use_pressure = True
+        cloth.settings.uniform_pressure_force = 5
+
+    def create_support_poles(self, context, support_points):
+        """Writes every pole, post and mast into the one TensileSupports mesh"""
+        for obj in [o for o in bpy.data.objects if o.name.startswith("TensilePole")]:
+            remove_output(obj.name, GENERATOR)  # Per-pole objects from older files
+
+        obj, mesh = replace_output(context, "TensileSupports", "TensileSupportsMesh", GENERATOR)
+        if np is not None:
+            tops = np.array(support_points, dtype=np.float64)
+            bases = tops * (1.0, 1.0, 0.0)
+            write_mesh_loops(mesh, *kernel.cylinders(bases, tops[:, 2], POLE_RADIUS, POLE_SEGMENTS))
+            return obj
+
+        bm = bmesh.new()
+        for x, y, z in support_points:
+            bmesh.ops.create_cone(
+                bm, cap_ends=True, segments=POLE_SEGMENTS, radius1=POLE_RADIUS, radius2=POLE_RADIUS,
+                depth=z, matrix=Matrix.Translation((x, y, z / 2)),
+            )
+        bm.to_mesh(mesh)
+        bm.free()
+        return obj
+
+class TensileFormFindOperator(bpy.types.Operator):
+    bl_idname = "object.tensile_membrane_form_find"
+    bl_label = "Form-find"
+    bl_description = "Solve the prestressed membrane shape hung from the pole, post and mast tops"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    tension: FloatProperty(name="Tension", description="Membrane prestress in N/m", default=1.0, min=0.001)
+    fabric_weight: FloatProperty(name="Fabric Weight", description="Membrane self weight in N/m²", default=0.0, min=0.0)
+    prestress_iterations: IntProperty(
+        name="Prestress Iterations", default=10, min=1, max=100,
+        description="Force density updates towards the target edge forces (1 solves the linear form only)"
+    )
+
+    def execute(self, context):
+        obj = bpy.data.objects.get("TensileStructure")
+        if obj is None or np is None:
+            self.report({'ERROR'}, "Form-find needs NumPy and a generated membrane")
+            return {'CANCELLED'}
+
+        mesh = obj.data
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3).astype(np.float64)
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        edges = edges.reshape(-1, 2)
+        areas = np.empty(len(mesh.polygons), dtype=np.float32)
+        mesh.polygons.foreach_get("area", areas)
+
+        # Each edge targets the prestress times its tributary width, its flat length
+        target_forces = self.tension * kernel.edge_lengths(coords, edges)
+
+        # Only the supports are pinned: the node nearest each one is lifted onto its top.
+        # Poles and posts take the nearest edge node, masts the nearest of any node.
+        support_points = obj.get("support_points", [])
+        edge_supports = obj.get("edge_supports", len(support_points))
+        boundary = boundary_vertices(mesh)
+        pinned = []
+        for i, (x, y, z) in enumerate(support_points):
+            candidates = boundary if i < edge_supports else np.arange(len(coords))
+            nearest = int(candidates[np.argmin((coords[candidates, 0] - x) ** 2 + (coords[candidates, 1] - y) ** 2)])
+            coords[nearest] = (x, y, z)
+            pinned.append(nearest)
+        if not pinned:
+            self.report({'ERROR'}, "The membrane has no support points, generate it again")
+            return {'CANCELLED'}
+
+        loads = np.zeros_like(coords)
+        loads[:, 2] = -self.fabric_weight * areas.sum() / len(coords)
+
+        try:
+            coords, forces, passes, error = kernel.find_prestressed_form(
+                coords, edges, pinned, target_forces, loads, self.prestress_iterations
+            )
+        except ValueError as failure:
+            self.report({'ERROR'}, f"Cannot form-find {obj.name}: {failure}")
+            return {'CANCELLED'}
+        mesh.vertices.foreach_set("co", coords.astype(np.float32).ravel())
+        if "force" in mesh.attributes:
+            mesh.attributes.remove(mesh.attributes["force"])
+        mesh.attributes.new("force", 'FLOAT', 'EDGE').data.foreach_set("value", forces.astype(np.float32))
+        mesh.update()
+
+        self.report(
+            {'INFO'},
+            f"Form found in {passes} passes ({error:.1%} off target), edge forces {forces.min():.3f} to {forces.max():.3f} N"
+        )
+        return {'FINISHED'}
+
+class TensilePanel(bpy.types.Panel):
+    bl_label = "Tensile Membrane Generator"
+    bl_idname = "OBJECT_PT_tensile_membrane"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Tensile Membrane'
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.operator("object.tensile_membrane_generate")
+        layout.operator("object.tensile_membrane_form_find")
+
+classes = [TensileGeneratorOperator, TensileFormFindOperator, TensilePanel]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,45 @@
+# Shared checks on (verts, loop_verts, loop_starts) polygon meshes for the kernel tests.
+
+import numpy as np
+
+
+def polygons(loop_verts, loop_starts):
+    """Splits flat loop arrays into a list of per-polygon vertex index arrays"""
+    loop_verts = np.asarray(loop_verts)
+    return np.split(loop_verts, np.asarray(loop_starts)[1:])
+
+
+def directed_edges(loop_verts, loop_starts):
+    """Every (a, b) edge of every polygon, in winding order"""
+    edges = []
+    for polygon in polygons(loop_verts, loop_starts):
+        edges.extend(zip(polygon.tolist(), np.roll(polygon, -1).tolist()))
+    return edges
+
+
+def is_closed_manifold(loop_verts, loop_starts):
+    """True when every directed edge appears exactly once and its reverse is used too.
+
+    That holds for a closed, consistently wound surface where every edge
+    joins exactly two faces.
+    """
+    edges = directed_edges(loop_verts, loop_starts)
+    unique = set(edges)
+    return len(unique) == len(edges) and all((b, a) in unique for a, b in edges)
+
+
+def volume(verts, loop_verts, loop_starts):
+    """Signed volume enclosed by the polygons, positive for outward facing normals"""
+    verts = np.asarray(verts, dtype=np.float64)
+    total = 0.0
+    for polygon in polygons(loop_verts, loop_starts):
+        a = verts[polygon[0]]
+        b, c = verts[polygon[1:-1]], verts[polygon[2:]]
+        total += np.einsum("ij,ij->i", np.broadcast_to(a, b.shape), np.cross(b, c)).sum()
+    return total / 6.0
+
+
+def face_mesh(faces):
+    """(loop_verts, loop_starts) of an (F, S) array of faces"""
+    faces = np.asarray(faces)
+    return faces.ravel(), np.arange(0, faces.size, faces.shape[1])
@@ -0,0 +1,91 @@
+# Force density form finding (arch_tools.kernel.form_find and find_prestressed_form).
+# Runs without Blender: python -m pytest tests
+
+import numpy as np
+import pytest
+
+from arch_tools.kernel import edge_lengths, find_prestressed_form, form_find
+
+
+def grid_membrane(cuts, size=5.0):
+    """(coords, edges, boundary) of a flat square grid of cuts x cuts nodes"""
+    xs = np.linspace(-size / 2, size / 2, cuts)
+    x, y = np.meshgrid(xs, xs, indexing="ij")
+    coords = np.column_stack((x.ravel(), y.ravel(), np.zeros(cuts * cuts)))
+    node = np.arange(cuts * cuts).reshape(cuts, cuts)
+    edges = np.vstack((
+        np.column_stack((node[:-1].ravel(), node[1:].ravel())),
+        np.column_stack((node[:, :-1].ravel(), node[:, 1:].ravel())),
+    ))
+    boundary = np.unique(np.concatenate((node[0], node[-1], node[:, 0], node[:, -1])))
+    return coords, edges, boundary
+
+
+def corner_pinned_membrane():
+    coords, edges, _ = grid_membrane(21)
+    corners = [0, 20, 420, 440]
+    coords[corners, 2] = 3.0
+    loads = np.zeros_like(coords)
+    loads[:, 2] = -0.5 * 25.0 / len(coords)
+    return coords, edges, corners, edge_lengths(coords, edges), loads
+
+
+def direct_solve(coords, edges, fixed, force_density, loads):
+    """Equilibrium coords from a sparse factorization of C_free^T Q C_free"""
+    scipy = pytest.importorskip("scipy")
+    pytest.importorskip("scipy.sparse.linalg")
+    n_edges = len(edges)
+    connectivity = scipy.sparse.csr_matrix(
+        (np.tile([1.0, -1.0], n_edges), (np.repeat(np.arange(n_edges), 2), edges.ravel())),
+        shape=(n_edges, len(coords)),
+    )
+    free = np.ones(len(coords), dtype=bool)
+    free[fixed] = False
+    q = scipy.sparse.diags(force_density)
+    c_free, c_fixed = connectivity[:, free], connectivity[:, ~free]
+    rhs = loads[free] - c_free.T @ (q @ (c_fixed @ coords[~free]))
+    solved = coords.copy()
+    solved[free] = scipy.sparse.linalg.spsolve((c_free.T @ q @ c_free).tocsc(), rhs)
+    return solved
+
+
+def test_form_find_matches_a_direct_solve():
+    coords, edges, corners, _, loads = corner_pinned_membrane()
+    force_density = np.random.default_rng(0).uniform(0.5, 2.0, len(edges))
+    found, iterations = form_find(coords, edges, corners, force_density, loads, tolerance=1e-10)
+    assert iterations > 0
+    np.testing.assert_allclose(found, direct_solve(coords, edges, corners, force_density, loads), atol=1e-8)
+
+
+def test_form_find_rejects_free_nodes_without_edges():
+    coords, edges, corners, targets, loads = corner_pinned_membrane()
+    coords = np.vstack((coords, (9.0, 9.0, 0.0)))  # An isolated, unpinned node
+    loads = np.vstack((loads, (0.0, 0.0, -1.0)))
+    with pytest.raises(ValueError, match="1 free nodes"):
+        form_find(coords, edges, corners, 1.0, loads)
+    with pytest.raises(ValueError, match="1 free nodes"):
+        find_prestressed_form(coords, edges, corners, targets, loads)
+
+
+def test_form_find_with_every_node_pinned_returns_the_input():
+    coords, edges, _ = grid_membrane(3)
+    found, iterations = form_find(coords, edges, np.arange(len(coords)), 1.0)
+    np.testing.assert_array_equal(found, coords)
+    assert iterations == 0
+
+
+def test_prestressed_form_returns_its_best_pass():
+    coords, edges, corners, targets, loads = corner_pinned_membrane()
+    errors = [
+        find_prestressed_form(coords, edges, corners, targets, loads, iterations)[3]
+        for iterations in range(1, 8)
+    ]
+    assert all(later <= earlier for earlier, later in zip(errors, errors[1:])), errors
+
+
+def test_prestressed_form_keeps_supports_in_place():
+    coords, edges, corners, targets, loads = corner_pinned_membrane()
+    found, forces, passes, error = find_prestressed_form(coords, edges, corners, targets, loads)
+    np.testing.assert_allclose(found[corners], coords[corners])
+    assert forces.shape == (len(edges),)
+    assert np.isfinite(error)
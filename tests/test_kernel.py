@@ -0,0 +1,138 @@
+# Box, grid and curtain wall geometry of arch_tools.kernel.
+# Runs without Blender: python -m pytest tests
+
+import numpy as np
+import pytest
+
+from arch_tools.kernel import (
+    box_arrays,
+    bilinear_grid,
+    curtain_wall_lattice,
+    cylinders,
+    face_loops,
+    group_panels,
+    grid_corner_indices,
+    grid_faces,
+    panel_kinds,
+    panel_size,
+)
+from mesh_checks import face_mesh, is_closed_manifold, volume
+
+
+def test_boxes_are_closed_and_face_outwards():
+    origins = [(0.0, 0.0, 0.0), (5.0, 1.0, 2.0), (-3.0, 4.0, 0.5)]
+    sizes = [(1.0, 2.0, 3.0), (0.5, 0.5, 0.5), (2.0, 0.1, 1.0)]
+    verts, faces = box_arrays(origins, sizes, rotations=np.array([0.0, 0.3, -1.2]))
+    assert verts.shape == (24, 3)
+    assert faces.shape == (18, 4)
+
+    for i, size in enumerate(sizes):
+        box = faces[6 * i:6 * i + 6]
+        assert box.min() == 8 * i and box.max() == 8 * i + 7
+        assert is_closed_manifold(*face_mesh(box))
+        assert volume(verts, *face_mesh(box)) == pytest.approx(np.prod(size))
+
+
+def test_box_origin_is_its_first_corner():
+    verts, _ = box_arrays([(1.0, 2.0, 3.0)], (4.0, 5.0, 6.0))
+    np.testing.assert_allclose(verts[0], (1.0, 2.0, 3.0))
+    np.testing.assert_allclose(verts.max(axis=0), (5.0, 7.0, 9.0))
+
+
+def test_cylinders_are_closed_and_face_outwards():
+    verts, loop_verts, loop_starts = cylinders([(0.0, 0.0, 0.0), (3.0, 0.0, 1.0)], [2.0, 0.5], 0.25, segments=32)
+    assert is_closed_manifold(loop_verts, loop_starts)
+    prism = 0.5 * 32 * np.sin(2 * np.pi / 32) * 0.25 ** 2  # Area of the inscribed 32-gon
+    assert volume(verts, loop_verts, loop_starts) == pytest.approx(prism * 2.5)
+
+
+def test_bilinear_grid_passes_through_its_corners():
+    corners = [(0.0, 0.0, 0.0), (4.0, 0.0, 1.0), (5.0, 3.0, 2.0), (-1.0, 2.0, 0.0)]
+    for cuts in (0, 1, 6):
+        grid = bilinear_grid(corners, cuts)
+        assert grid.shape == ((cuts + 2) ** 2, 3)
+        np.testing.assert_allclose(grid[grid_corner_indices(cuts)], corners)
+
+
+def test_bilinear_grid_centre_is_the_corner_average():
+    corners = np.array([(0.0, 0.0, 0.0), (4.0, 0.0, 1.0), (5.0, 3.0, 2.0), (-1.0, 2.0, 0.0)])
+    grid = bilinear_grid(corners, 1)
+    np.testing.assert_allclose(grid[4], corners.mean(axis=0))
+    np.testing.assert_allclose(grid[1], (corners[0] + corners[1]) / 2)  # u runs towards corner 2
+    np.testing.assert_allclose(grid[3], (corners[0] + corners[3]) / 2)  # v runs towards corner 4
+
+
+def test_grid_faces_tile_the_grid():
+    cuts = 3
+    corners = [(0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (2.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+    verts = bilinear_grid(corners, cuts)
+    faces = grid_faces(cuts)
+    assert faces.shape == ((cuts + 1) ** 2, 4)
+    assert np.array_equal(np.unique(faces), np.arange((cuts + 2) ** 2))
+
+    # Every cell faces the same way and together they cover the quad
+    a, b, c = verts[faces[:, 0]], verts[faces[:, 1]], verts[faces[:, 2]]
+    normals = np.cross(b - a, c - a)
+    assert np.all(normals[:, 2] > 0)
+    assert normals[:, 2].sum() == pytest.approx(2.0)
+
+    # Interior edges are shared by two cells wound in opposite directions
+    edges = set()
+    for face in faces:
+        for a, b in zip(face, np.roll(face, -1)):
+            assert (a, b) not in edges
+            edges.add((a, b))
+    assert sum((b, a) in edges for a, b in edges) == 2 * 2 * cuts * (cuts + 1)
+
+
+def test_face_loops_flatten_faces():
+    faces = np.array([(0, 1, 2), (2, 1, 3), (3, 4, 5)])
+    loop_verts, loop_starts = face_loops(faces)
+    assert loop_verts.tolist() == [0, 1, 2, 2, 1, 3, 3, 4, 5]
+    assert loop_starts.tolist() == [0, 3, 6]
+
+
+@pytest.mark.parametrize("columns, rows", [(1, 1), (5, 5), (3, 7)])
+def test_curtain_wall_frame_is_watertight(columns, rows):
+    width, height, thickness, depth = 5.0, 10.0, 0.1, 0.2
+    frame_verts, frame_faces, panel_verts, panel_faces = curtain_wall_lattice(
+        width, height, columns, rows, thickness, depth
+    )
+    loops = face_loops(frame_faces)
+    assert is_closed_manifold(*loops)
+
+    panel_width, panel_height = panel_size(width, height, columns, rows, thickness)
+    expected = (width * height - columns * rows * panel_width * panel_height) * depth
+    assert volume(frame_verts, *loops) == pytest.approx(expected)
+
+    assert panel_faces.shape == (columns * rows, 4)
+    corners = panel_verts.reshape(-1, 4, 3)
+    np.testing.assert_allclose(corners[:, 2, 0] - corners[:, 0, 0], panel_width)
+    np.testing.assert_allclose(corners[:, 2, 2] - corners[:, 0, 2], panel_height)
+    assert corners[..., 0].min() == pytest.approx(thickness)
+    assert corners[..., 0].max() == pytest.approx(width - thickness)
+    assert corners[..., 2].max() == pytest.approx(height - thickness)
+
+
+def test_curtain_wall_panels_fill_the_openings():
+    width, height, columns, rows, thickness = 4.0, 3.0, 4, 3, 0.05
+    _, _, panel_verts, _ = curtain_wall_lattice(width, height, columns, rows, thickness, 0.1)
+    panel_width, panel_height = panel_size(width, height, columns, rows, thickness)
+    origins = panel_verts.reshape(-1, 4, 3)[:, 0]
+
+    # Column-major: one column of rows, then the next column
+    column, row = np.divmod(np.arange(columns * rows), rows)
+    np.testing.assert_allclose(origins[:, 0], thickness + column * (panel_width + thickness))
+    np.testing.assert_allclose(origins[:, 2], thickness + row * (panel_height + thickness))
+
+
+def test_panels_group_by_size_and_kind():
+    columns, rows = 3, 6
+    _, _, panel_verts, _ = curtain_wall_lattice(6.0, 9.0, columns, rows, 0.1, 0.2)
+    kinds = panel_kinds(columns, rows, spandrel_interval=3)
+    assert kinds.sum() == columns * 2
+
+    prototypes, instance_type, origins = group_panels(panel_verts, kinds)
+    assert [kind for _, _, kind in prototypes] == ["Vision", "Spandrel"]
+    assert np.bincount(instance_type).tolist() == [columns * 4, columns * 2]
+    assert len(origins) == columns * rows
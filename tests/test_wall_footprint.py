@@ -0,0 +1,88 @@
+# Wall network footprints and their extrusion (arch_tools.kernel.wall_footprint).
+# Runs without Blender: python -m pytest tests
+
+import numpy as np
+import pytest
+
+from arch_tools.kernel import extrude_footprint, wall_footprint
+from mesh_checks import is_closed_manifold, volume
+
+THICKNESS = 0.2
+HEIGHT = 3.0
+
+
+def walls(coords, edges, thickness=THICKNESS, height=HEIGHT):
+    """Extruded (verts, loop_verts, loop_starts) of a wall network"""
+    footprint = wall_footprint(np.array(coords, dtype=np.float64), edges, thickness)
+    return extrude_footprint(*footprint, height)
+
+
+def assert_solid(coords, edges, area):
+    """The walls are one closed, outward facing solid of the given footprint area"""
+    verts, loop_verts, loop_starts = walls(coords, edges)
+    assert is_closed_manifold(loop_verts, loop_starts)
+    assert volume(verts, loop_verts, loop_starts) == pytest.approx(area * HEIGHT)
+    return verts, loop_verts, loop_starts
+
+
+def test_free_ends_are_cut_square():
+    verts, _, loop_starts = assert_solid([(0, 0, 0), (4, 0, 0)], [(0, 1)], 4 * THICKNESS)
+    assert len(loop_starts) == 6  # A box
+    np.testing.assert_allclose(verts[:, 0].min(), 0.0)
+    np.testing.assert_allclose(verts[:, 1].max(), THICKNESS / 2)
+
+
+def test_l_junction_is_mitred():
+    # A mitred corner adds as much area outside the centrelines as it loses inside
+    assert_solid([(0, 0, 0), (4, 0, 0), (4, 3, 0)], [(0, 1), (1, 2)], 7 * THICKNESS)
+
+
+def test_straight_continuation_has_no_corner():
+    assert_solid([(0, 0, 0), (2, 0, 0), (5, 0, 0)], [(0, 1), (1, 2)], 5 * THICKNESS)
+
+
+def test_t_junction():
+    # The stem starts at the face of the through wall
+    coords = [(0, 0, 0), (4, 0, 0), (2, 0, 0), (2, 3, 0)]
+    assert_solid(coords, [(0, 2), (2, 1), (2, 3)], (4 + 3 - THICKNESS / 2) * THICKNESS)
+
+
+def test_x_junction():
+    # Four arms, each starting at the edge of the central hub square
+    coords = [(0, 0, 0), (4, 0, 0), (2, 0, 0), (2, 3, 0), (2, -3, 0)]
+    arms = (2 + 2 + 3 + 3 - 4 * THICKNESS / 2) * THICKNESS
+    assert_solid(coords, [(0, 2), (2, 1), (2, 3), (2, 4)], arms + THICKNESS ** 2)
+
+
+def test_closed_loop():
+    coords = [(0, 0, 0), (4, 0, 0), (4, 3, 0), (0, 3, 0)]
+    outer = (4 + THICKNESS) * (3 + THICKNESS)
+    inner = (4 - THICKNESS) * (3 - THICKNESS)
+    assert_solid(coords, [(0, 1), (1, 2), (2, 3), (3, 0)], outer - inner)
+
+
+def test_duplicate_edges_are_built_once():
+    coords = [(0, 0, 0), (4, 0, 0), (4, 3, 0)]
+    assert_solid(coords, [(0, 1), (1, 0), (1, 2), (1, 2)], 7 * THICKNESS)
+
+
+def test_zero_length_edges_are_skipped():
+    coords = [(0, 0, 0), (4, 0, 0), (4, 0, 0), (4, 3, 0)]
+    assert_solid(coords, [(0, 1), (1, 2), (2, 3), (3, 3)], 7 * THICKNESS)
+
+
+def test_isolated_vertices_are_ignored():
+    verts, _, _ = assert_solid([(0, 0, 0), (4, 0, 0), (9, 9, 0)], [(0, 1)], 4 * THICKNESS)
+    assert verts[:, 0].max() == pytest.approx(4.0)
+
+
+def test_walls_stand_on_their_nodes():
+    verts, _, _ = assert_solid([(0, 0, 1), (4, 0, 1), (4, 3, 1)], [(0, 1), (1, 2)], 7 * THICKNESS)
+    np.testing.assert_allclose((verts[:, 2].min(), verts[:, 2].max()), (1.0, 1.0 + HEIGHT))
+
+
+def test_empty_network_builds_nothing():
+    for coords in (np.zeros((0, 3)), [(0, 0, 0), (1, 0, 0)]):
+        verts, loop_verts, loop_starts = walls(coords, np.zeros((0, 2), dtype=int))
+        assert verts.shape == (0, 3)
+        assert len(loop_verts) == len(loop_starts) == 0
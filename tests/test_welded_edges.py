@@ -0,0 +1,49 @@
+# Welding of drafted and imported linework endpoints (arch_tools.kernel.WeldedEdges).
+# Runs without Blender: python -m pytest tests
+
+import numpy as np
+
+from arch_tools.kernel import WeldedEdges
+
+LAYER_WELD_DISTANCE = 1e-4  # drafting_tools.LAYER_WELD_DISTANCE, the import's default Weld Distance
+
+
+def test_endpoints_straddling_a_cell_boundary_are_welded():
+    # Pairs 2e-5 apart around positions that sweep across several weld cells,
+    # appended separately as if they came from different import batches
+    for middle in np.linspace(0.0, 4 * LAYER_WELD_DISTANCE, 41):
+        network = WeldedEdges(tolerance=LAYER_WELD_DISTANCE)
+        network.append([(middle - 1e-5, 0.0, 0.0)], [(1.0, 0.0, 0.0)])
+        network.append([(middle + 1e-5, 0.0, 0.0)], [(0.0, 1.0, 0.0)])
+        assert len(network.coords) == 3, middle
+        assert len(network.edges) == 2
+
+
+def test_endpoints_straddling_a_cell_corner_in_one_batch_are_welded():
+    offset = np.full(3, 1e-5)
+    for middle in np.linspace(0.0, 4 * LAYER_WELD_DISTANCE, 41):
+        corner = np.full(3, middle)
+        network = WeldedEdges(tolerance=LAYER_WELD_DISTANCE)
+        network.append([corner - offset, (5.0, 0.0, 0.0)], [(5.0, 5.0, 0.0), corner + offset])
+        assert len(network.coords) == 3, middle
+
+
+def test_endpoints_further_apart_than_the_tolerance_stay_split():
+    network = WeldedEdges(tolerance=LAYER_WELD_DISTANCE)
+    network.append([(0.0, 0.0, 0.0)], [(1.5 * LAYER_WELD_DISTANCE, 0.0, 0.0)])
+    assert len(network.coords) == 2
+    assert len(network.edges) == 1
+
+
+def test_large_batch_welds_every_point_within_the_tolerance():
+    tolerance = LAYER_WELD_DISTANCE
+    points = np.random.default_rng(0).random((4000, 3)) * 30 * tolerance
+    network = WeldedEdges(tolerance=tolerance)
+    for batch in np.split(points, 4):
+        ids = network.weld(batch)
+        assert (np.linalg.norm(network.coords[ids] - batch, axis=1) <= tolerance).all()
+
+    coords = network.coords
+    gaps = np.linalg.norm(coords[:, None] - coords[None], axis=2)
+    np.fill_diagonal(gaps, np.inf)
+    assert gaps.min() > tolerance